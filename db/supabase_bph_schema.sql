@@ -87,3 +87,17 @@ SELECT
     MIN(year) as earliest_year,
     MAX(year) as latest_year
 FROM bph_works;
+
+-- Functions
+
+-- Reproducible random sample of works in a year range, drawn server-side.
+-- Ordering by a seeded hash of the id keeps the sample stable for a given seed.
+CREATE OR REPLACE FUNCTION bph_random_sample(n INTEGER, seed INTEGER, year_from INTEGER, year_to INTEGER)
+RETURNS SETOF bph_works
+LANGUAGE sql STABLE
+AS $$
+    SELECT * FROM bph_works
+    WHERE year >= year_from AND year <= year_to
+    ORDER BY md5(id || ':' || seed::TEXT)
+    LIMIT n;
+$$;
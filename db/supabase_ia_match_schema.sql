@@ -19,6 +19,39 @@ ADD COLUMN IF NOT EXISTS ia_matched_at TIMESTAMP WITH TIME ZONE;
 CREATE INDEX IF NOT EXISTS idx_bph_works_ia_identifier ON bph_works(ia_identifier);
 CREATE INDEX IF NOT EXISTS idx_bph_works_ia_match_confidence ON bph_works(ia_match_confidence);
 
+-- Apply a batch of matches in a single UPDATE ... FROM statement.
+-- Called via RPC by bph_ia_search_match.py instead of one UPDATE per work.
+CREATE OR REPLACE FUNCTION apply_ia_matches(matches JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH updated AS (
+        UPDATE bph_works bph
+        SET ia_identifier = m.ia_identifier,
+            ia_url = m.ia_url,
+            ia_match_confidence = m.ia_match_confidence,
+            ia_match_method = m.ia_match_method,
+            ia_title_similarity = m.ia_title_similarity,
+            ia_author_match = m.ia_author_match,
+            ia_year_match = m.ia_year_match,
+            ia_matched_at = m.ia_matched_at
+        FROM jsonb_to_recordset(matches) AS m(
+            id TEXT,
+            ia_identifier TEXT,
+            ia_url TEXT,
+            ia_match_confidence TEXT,
+            ia_match_method TEXT,
+            ia_title_similarity NUMERIC,
+            ia_author_match BOOLEAN,
+            ia_year_match BOOLEAN,
+            ia_matched_at TIMESTAMP WITH TIME ZONE
+        )
+        WHERE bph.id = m.id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
+
 -- ==============================================================
 -- OPTION 2: Create separate matches table (more flexible)
 -- Uncomment if you prefer a separate table
@@ -217,6 +217,24 @@ LEFT JOIN digitization_status d ON w.id = d.istc_id
 GROUP BY language
 ORDER BY total DESC;
 
+-- ============================================
+-- FUNCTIONS
+-- ============================================
+
+-- Title lookup for many prefixes in one call; up to 5 works per prefix
+CREATE OR REPLACE FUNCTION match_istc(prefixes TEXT[])
+RETURNS TABLE (prefix TEXT, id TEXT, author TEXT, title TEXT, date_single INTEGER, place TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT p.prefix, w.id, w.author, w.title, w.date_single, w.place
+    FROM unnest(prefixes) AS p(prefix)
+    CROSS JOIN LATERAL (
+        SELECT * FROM istc_works i
+        WHERE i.title ILIKE '%' || p.prefix || '%'
+        LIMIT 5
+    ) w;
+$$;
+
 -- ============================================
 -- ROW LEVEL SECURITY (optional)
 -- ============================================
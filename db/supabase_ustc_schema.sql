@@ -114,3 +114,17 @@ FROM ustc_editions
 WHERE classification_1 IS NOT NULL
 GROUP BY classification_1
 ORDER BY total DESC;
+
+-- Title lookup for many prefixes in one call; up to 5 editions per prefix
+CREATE OR REPLACE FUNCTION match_ustc(prefixes TEXT[])
+RETURNS TABLE (prefix TEXT, id INTEGER, author_1 TEXT, title TEXT, year INTEGER, place TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT p.prefix, e.id, e.author_1, e.title, e.year, e.place
+    FROM unnest(prefixes) AS p(prefix)
+    CROSS JOIN LATERAL (
+        SELECT * FROM ustc_editions u
+        WHERE u.title ILIKE '%' || p.prefix || '%'
+        LIMIT 5
+    ) e;
+$$;
@@ -11,14 +11,27 @@ then checks digitization coverage in:
 Fixes HathiTrust search from v1.
 """
 
+import argparse
+import asyncio
 import json
+import logging
 import random
-import time
 import os
-import requests
+import sqlite3
+import sys
+import time
+import httpx
+from rapidfuzz import fuzz, process
+from collections import defaultdict
 from pathlib import Path
+from urllib.parse import quote, urlencode
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to load supabase
 try:
     from supabase import create_client, Client
@@ -28,9 +41,44 @@ except ImportError:
     subprocess.run(["pip", "install", "supabase"], check=True)
     from supabase import create_client, Client
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
 # Configuration
 OUTPUT_DIR = Path(__file__).parent.parent / "data" / "coverage_experiment"
 SAMPLE_SIZE = 100
+PAGE_SIZE = 1000  # Rows per Supabase page (PostgREST max_rows)
+ID_BATCH_SIZE = 200  # Ids per .in_() filter, keeps request URLs short
+CONCURRENCY = 16  # Works searched at once (one request per host each)
+POOL_SIZE = 64    # Keep-alive connections shared by both experiments and all hosts
+
+# On-disk cache of search responses, so re-runs skip repeated queries
+CACHE_PATH = OUTPUT_DIR / "http_cache.sqlite"
+CHECKPOINT_PATH = OUTPUT_DIR / "coverage_v2.partial.jsonl"  # Finished works of an interrupted run
+CACHE_TTL = 7 * 24 * 3600  # Seconds
+CACHEABLE_STATUSES = (200, 404)
+
+# Google Books batching: several titles OR'd into one request, volumes
+# attributed back to a title by fuzzy match
+GB_BATCH_SIZE = 5
+GB_MAX_RESULTS = 40
+GB_MATCH_THRESHOLD = 80
+
+# Partial-response field selectors for minimal (coverage-only) searches
+IA_MINIMAL_FIELDS = ['identifier']
+GB_MINIMAL_FIELDS = 'totalItems,items(volumeInfo(title,authors,infoLink))'
+
+# Adaptive per-host rate limiting: spacing doubles on HTTP 429, shrinks by
+# 10% after every 3 successful responses
+MIN_REQUEST_INTERVAL = 0.1  # Seconds between requests to one host
+MAX_REQUEST_INTERVAL = 30.0
+RATE_LIMIT_RETRIES = 5
+
+# Query sanitization tables: quotes break phrase queries, ':' and '/' break
+# field syntax and HathiTrust title paths
+_STRIP_QUOTES = str.maketrans({'"': None})
+_IA_TITLE = str.maketrans({'"': None, ':': None})
+_HT_TITLE = str.maketrans({'"': None, ':': None, '/': ' '})
 
 # Supabase config
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://ykhxaecbbxaaqlujuzde.supabase.co")
@@ -39,24 +87,182 @@ SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXV
 def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
-def sample_istc_from_supabase(n=100, seed=123):
+class ResponseCache:
+    """SQLite store of JSON responses keyed on URL plus sorted query params."""
+
+    def __init__(self, path, ttl=CACHE_TTL):
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, status INTEGER, body TEXT, fetched_at REAL)"
+        )
+
+    def get(self, key):
+        """Return (status, data) for a fresh entry, or None."""
+        row = self.conn.execute(
+            "SELECT status, body, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or time.time() - row[2] > self.ttl:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, key, status, data):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (key, status, json.dumps(data), time.time())
+        )
+        self.conn.commit()
+
+# Set by main(); None disables caching (--no-cache)
+RESPONSE_CACHE = None
+
+class HostThrottle:
+    """Adaptive spacing between requests to one host."""
+
+    def __init__(self):
+        self.interval = MIN_REQUEST_INTERVAL
+        self.next_at = 0.0
+        self.successes = 0
+
+    async def wait(self):
+        """Sleep until this request's slot; slots are handed out interval apart."""
+        now = time.monotonic()
+        slot = max(now, self.next_at)
+        self.next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def slow_down(self):
+        self.interval = min(self.interval * 2, MAX_REQUEST_INTERVAL)
+        self.successes = 0
+
+    def succeeded(self):
+        self.successes += 1
+        if self.successes >= 3:
+            self.interval = max(self.interval * 0.9, MIN_REQUEST_INTERVAL)
+            self.successes = 0
+
+HOST_THROTTLES = defaultdict(HostThrottle)
+
+def retry_after_seconds(response):
+    """Seconds from a numeric Retry-After header, or None."""
+    value = response.headers.get('Retry-After', '')
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+async def fetch_json(client, url, params=None):
+    """GET a JSON endpoint through the response cache; returns (status, data)."""
+    key = url + ('?' + urlencode(sorted(params.items()), doseq=True) if params else '')
+    if RESPONSE_CACHE is not None:
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    throttle = HOST_THROTTLES[httpx.URL(url).host]
+    for _ in range(RATE_LIMIT_RETRIES + 1):
+        await throttle.wait()
+        response = await client.get(url, params=params)
+        if response.status_code != 429:
+            break
+        # Rate limited: widen the spacing for the host and retry
+        throttle.slow_down()
+        await asyncio.sleep(retry_after_seconds(response) or throttle.interval)
+    else:
+        # Still limited; raise so the search records an error, not "not found"
+        response.raise_for_status()
+
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        throttle.slow_down()
+    else:
+        throttle.succeeded()
+
+    data = response.json() if response.status_code == 200 else None
+    if RESPONSE_CACHE is not None and response.status_code in CACHEABLE_STATUSES:
+        RESPONSE_CACHE.put(key, response.status_code, data)
+    return response.status_code, data
+
+def dump_json(data, indent=False):
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+def load_checkpoint(path):
+    """Results already written to a checkpoint file, keyed by (source, id).
+
+    A line cut short by a crash is ignored, as is a result where any service
+    returned an error (e.g. it ran out of rate-limit retries); those works are
+    simply searched again.
+    """
+    completed = {}
+    if not path.exists():
+        return completed
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                result = orjson.loads(line) if orjson else json.loads(line)
+            except ValueError:
+                continue
+            if any('error' in result[service] for service in ('internet_archive', 'hathitrust', 'google_books')):
+                continue
+            completed[(result['source'], result['id'])] = result
+    return completed
+
+def make_http_client():
+    """Async HTTP client whose keep-alive pool is reused across all searches."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=30)
+
+def fetch_ids(make_query, limit=None):
+    """Page through a Supabase id query, returning up to limit ids (all if None).
+
+    make_query builds a fresh query for each page: postgrest builders modify
+    themselves in place, so reusing one would stack order/range parameters.
+    """
+    ids = []
+    start = 0
+    while limit is None or start < limit:
+        end = start + PAGE_SIZE if limit is None else min(start + PAGE_SIZE, limit)
+        result = make_query().order('id').range(start, end - 1).execute()
+        ids.extend(row['id'] for row in result.data)
+        if len(result.data) < end - start:
+            break
+        start = end
+    return ids
+
+def fetch_rows_by_id(client, table, columns, ids):
+    """Fetch rows for the given ids with batched WHERE id IN (...) queries."""
+    rows = {}
+    for start in range(0, len(ids), ID_BATCH_SIZE):
+        batch = ids[start:start + ID_BATCH_SIZE]
+        result = client.table(table).select(columns).in_('id', batch).execute()
+        rows.update((row['id'], row) for row in result.data)
+    return rows
+
+def sample_istc_from_supabase(n=100, seed=123, client=None):
     """Sample n Latin works from ISTC in Supabase."""
-    client = get_supabase_client()
+    client = client or get_supabase_client()
+
+    # Planner estimate of Latin works; the id scan below pages to the end regardless
+    result = client.table('istc_works').select('id', count='estimated').eq('language', 'lat').limit(1).execute()
+    print(f"ISTC Latin works in Supabase: ~{result.count:,}")
 
-    # Get total count of Latin works
-    result = client.table('istc_works').select('id', count='exact').eq('language', 'lat').execute()
-    total = result.count
-    print(f"ISTC Latin works in Supabase: {total:,}")
+    # Fetch the ids once, sample locally, then fetch the sampled rows by id
+    ids = fetch_ids(lambda: client.table('istc_works').select('id').eq('language', 'lat'))
+    sampled = random.Random(seed).sample(ids, min(n, len(ids)))
 
-    # Generate random offsets
-    random.seed(seed)
-    offsets = random.sample(range(total), min(n, total))
+    rows = fetch_rows_by_id(client, 'istc_works', 'id, author, title, date_single, place, printer', sampled)
 
     works = []
-    for offset in offsets:
-        result = client.table('istc_works').select('id, author, title, date_single, place, printer').eq('language', 'lat').range(offset, offset).execute()
-        if result.data:
-            work = result.data[0]
+    for work_id in sampled:
+        if work_id in rows:
+            work = rows[work_id]
             works.append({
                 'id': work['id'],
                 'author': work.get('author') or '',
@@ -69,24 +275,25 @@ def sample_istc_from_supabase(n=100, seed=123):
 
     return works
 
-def sample_ustc_from_supabase(n=100, seed=456):
+def sample_ustc_from_supabase(n=100, seed=456, client=None):
     """Sample n Latin editions from USTC in Supabase."""
-    client = get_supabase_client()
+    client = client or get_supabase_client()
+
+    # Planner estimate of Latin editions; the id scan below is capped independently
+    result = client.table('ustc_editions').select('id', count='estimated').eq('language_1', 'Latin').limit(1).execute()
+    print(f"USTC Latin editions in Supabase: ~{result.count:,}")
 
-    # Get total count of Latin editions
-    result = client.table('ustc_editions').select('id', count='exact').eq('language_1', 'Latin').limit(1).execute()
-    total = result.count
-    print(f"USTC Latin editions in Supabase: {total:,}")
+    # Fetch the ids once, sample locally, then fetch the sampled rows by id
+    ids = fetch_ids(lambda: client.table('ustc_editions').select('id').eq('language_1', 'Latin'),
+                    100000)  # Limit to first 100k for speed
+    sampled = random.Random(seed).sample(ids, min(n, len(ids)))
 
-    # Generate random offsets
-    random.seed(seed)
-    offsets = random.sample(range(min(total, 100000)), min(n, total))  # Limit to first 100k for speed
+    rows = fetch_rows_by_id(client, 'ustc_editions', 'id, author_1, title, year, place, printer_1', sampled)
 
     works = []
-    for offset in offsets:
-        result = client.table('ustc_editions').select('id, author_1, title, year, place, printer_1').eq('language_1', 'Latin').range(offset, offset).execute()
-        if result.data:
-            work = result.data[0]
+    for work_id in sampled:
+        if work_id in rows:
+            work = rows[work_id]
             works.append({
                 'id': str(work['id']),
                 'author': work.get('author_1') or '',
@@ -99,16 +306,20 @@ def sample_ustc_from_supabase(n=100, seed=456):
 
     return works
 
-def search_internet_archive(title, author=""):
-    """Search Internet Archive for a work."""
+async def search_internet_archive(client, title, author="", minimal=True):
+    """Search Internet Archive for a work.
+
+    minimal requests only identifiers for the three kept results and takes
+    num_results from numFound, instead of five full documents.
+    """
     try:
         # Build search query
         query_parts = []
         if title:
-            clean_title = title.replace('"', '').replace(':', '')[:100]
+            clean_title = title.translate(_IA_TITLE)[:100]
             query_parts.append(f'title:"{clean_title}"')
         if author:
-            clean_author = author.replace('"', '')[:50]
+            clean_author = author.translate(_STRIP_QUOTES)[:50]
             query_parts.append(f'creator:"{clean_author}"')
 
         query = ' AND '.join(query_parts) if query_parts else title[:50]
@@ -116,18 +327,17 @@ def search_internet_archive(title, author=""):
         url = "https://archive.org/advancedsearch.php"
         params = {
             'q': query,
-            'fl[]': ['identifier', 'title', 'creator', 'date', 'mediatype'],
-            'rows': 5,
+            'fl[]': IA_MINIMAL_FIELDS if minimal else ['identifier', 'title', 'creator', 'date', 'mediatype'],
+            'rows': 3 if minimal else 5,
             'output': 'json'
         }
 
-        response = requests.get(url, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = await fetch_json(client, url, params)
+        if status == 200:
             docs = data.get('response', {}).get('docs', [])
             return {
                 'found': len(docs) > 0,
-                'num_results': len(docs),
+                'num_results': data['response'].get('numFound', len(docs)) if minimal else len(docs),
                 'results': docs[:3]
             }
     except Exception as e:
@@ -135,21 +345,21 @@ def search_internet_archive(title, author=""):
 
     return {'found': False, 'num_results': 0, 'results': []}
 
-def search_hathitrust(title, author=""):
+async def search_hathitrust(client, title, author=""):
     """Search HathiTrust using their Solr-based catalog search."""
     try:
-        # Use HathiTrust's full-text search API
-        # Format: https://catalog.hathitrust.org/api/volumes/full/title/TITLE.json
+        # Use HathiTrust's bibliographic API
+        # Format: https://catalog.hathitrust.org/api/volumes/brief/title/TITLE.json
 
-        # Clean and truncate title
-        clean_title = title.replace('"', '').replace(':', '').replace('/', ' ')[:80]
+        # The catalog prefix-matches titles, so the first few words recall
+        # everything the full title would; one request per work is enough
+        clean_title = title.translate(_HT_TITLE)[:80]
+        short_query = ' '.join(clean_title.split()[:4])
 
-        # Try the bibliographic API first
-        url = f"https://catalog.hathitrust.org/api/volumes/brief/title/{requests.utils.quote(clean_title)}.json"
+        url = f"https://catalog.hathitrust.org/api/volumes/brief/title/{quote(short_query)}.json"
+        status, data = await fetch_json(client, url)
 
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             records = data.get('records', {})
             items = data.get('items', [])
 
@@ -160,40 +370,48 @@ def search_hathitrust(title, author=""):
                     'results': list(records.values())[:3] if records else items[:3]
                 }
 
-        # Try OCLC number search if we have one
-        # Fallback: try a broader search with just first few words
-        words = clean_title.split()[:4]
-        short_query = ' '.join(words)
-
-        url2 = f"https://catalog.hathitrust.org/api/volumes/brief/title/{requests.utils.quote(short_query)}.json"
-        response2 = requests.get(url2, timeout=30)
-
-        if response2.status_code == 200:
-            data2 = response2.json()
-            records2 = data2.get('records', {})
-            items2 = data2.get('items', [])
-
-            if records2 or items2:
-                return {
-                    'found': True,
-                    'num_results': len(records2) if records2 else len(items2),
-                    'results': list(records2.values())[:3] if records2 else items2[:3]
-                }
-
     except Exception as e:
         return {'found': False, 'error': str(e), 'num_results': 0, 'results': []}
 
     return {'found': False, 'num_results': 0, 'results': []}
 
-def search_google_books(title, author=""):
-    """Search Google Books API for a work."""
+def format_google_books_items(items):
+    """Condensed title/authors/link for the first three volumes."""
+    return [
+        {
+            'title': item.get('volumeInfo', {}).get('title'),
+            'authors': item.get('volumeInfo', {}).get('authors', []),
+            'link': item.get('volumeInfo', {}).get('infoLink')
+        }
+        for item in items[:3]
+    ]
+
+def phrase_title(title, limit=80):
+    """Title without quotes, cut at the last word boundary within limit characters.
+
+    Used inside quoted intitle phrases, where a trailing word fragment would
+    stop the phrase from matching.
+    """
+    clean = title.translate(_STRIP_QUOTES)
+    if len(clean) <= limit:
+        return clean
+    words = clean[:limit + 1].split()
+    if not clean[limit].isspace():
+        words = words[:-1]  # The last word was cut mid-way
+    return ' '.join(words) or clean[:limit]
+
+async def search_google_books(client, title, author="", minimal=True):
+    """Search Google Books API for a work.
+
+    minimal asks the API for only the fields kept in the results.
+    """
     try:
         query_parts = []
         if title:
-            clean_title = title.replace('"', '')[:80]
+            clean_title = title.translate(_STRIP_QUOTES)[:80]
             query_parts.append(f'intitle:{clean_title}')
         if author:
-            clean_author = author.replace('"', '')[:40]
+            clean_author = author.translate(_STRIP_QUOTES)[:40]
             query_parts.append(f'inauthor:{clean_author}')
 
         query = '+'.join(query_parts) if query_parts else title[:50]
@@ -204,85 +422,170 @@ def search_google_books(title, author=""):
             'maxResults': 5,
             'printType': 'books'
         }
+        if minimal:
+            params['fields'] = GB_MINIMAL_FIELDS
 
-        response = requests.get(url, params=params, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = await fetch_json(client, url, params)
+        if status == 200:
             items = data.get('items', [])
             return {
                 'found': len(items) > 0,
                 'num_results': data.get('totalItems', 0),
-                'results': [
-                    {
-                        'title': item.get('volumeInfo', {}).get('title'),
-                        'authors': item.get('volumeInfo', {}).get('authors', []),
-                        'link': item.get('volumeInfo', {}).get('infoLink')
-                    }
-                    for item in items[:3]
-                ]
+                'results': format_google_books_items(items)
             }
     except Exception as e:
         return {'found': False, 'error': str(e)}
 
     return {'found': False, 'num_results': 0, 'results': []}
 
-def run_experiment_on_sample(works, source_name):
-    """Run coverage experiment on a list of works."""
-    results = []
+async def search_google_books_batch(client, semaphore, queries):
+    """Search Google Books for several (title, author) queries in one request.
+
+    Titles are OR'd together and each returned volume is attributed to the
+    best fuzzy-matching title, and so to every query with that title. Falls
+    back to one request per query if the batched request fails.
+    """
+    titles = [title for title, _ in queries]
+    if len(queries) == 1 or not all(titles):
+        async with semaphore:
+            results = await asyncio.gather(*[search_google_books(client, title, author)
+                                             for title, author in queries])
+        return dict(zip(queries, results))
+
+    # Queries differing only in author share a title
+    title_positions = defaultdict(list)
+    for i, title in enumerate(titles):
+        title_positions[title].append(i)
+    distinct_titles = list(title_positions)
+
+    params = {
+        'q': ' OR '.join(f'intitle:"{phrase_title(title)}"' for title in distinct_titles),
+        'maxResults': GB_MAX_RESULTS,
+        'printType': 'books',
+        'fields': GB_MINIMAL_FIELDS
+    }
+    try:
+        async with semaphore:
+            status, data = await fetch_json(client, "https://www.googleapis.com/books/v1/volumes", params)
+        if status != 200:
+            raise ValueError(f"HTTP {status}")
+    except Exception:
+        async with semaphore:
+            results = await asyncio.gather(*[search_google_books(client, title, author)
+                                             for title, author in queries])
+        return dict(zip(queries, results))
+
+    matched = defaultdict(list)
+    for item in data.get('items', []):
+        match = process.extractOne(item.get('volumeInfo', {}).get('title') or '', distinct_titles,
+                                   scorer=fuzz.WRatio, score_cutoff=GB_MATCH_THRESHOLD)
+        if match:
+            for i in title_positions[distinct_titles[match[2]]]:
+                matched[i].append(item)
+
+    return {
+        query: {
+            'found': bool(matched[i]),
+            'num_results': len(matched[i]),
+            'results': format_google_books_items(matched[i])
+        }
+        for i, query in enumerate(queries)
+    }
+
+async def probe(client, semaphore, title, author, google_books):
+    """Search all three services for one (title, author) query concurrently.
+
+    google_books is the shared task for the Google Books batch holding this query.
+    """
+    async with semaphore:
+        ia_result, ht_result = await asyncio.gather(
+            search_internet_archive(client, title, author),
+            search_hathitrust(client, title, author),
+        )
+    gb_result = (await google_books)[(title, author)]
+    return ia_result, ht_result, gb_result
+
+def describe_search(result):
+    """Short status of one search for the progress log: hit count, 'none' or 'error'."""
+    if result.get('found'):
+        return str(result.get('num_results', 0))
+    return 'error' if 'error' in result else 'none'
+
+async def run_experiment_on_sample(client, works, source_name, jsonl=None, completed=None):
+    """Run coverage experiment on a list of works using a shared HTTP client.
+
+    Each finished result is also appended to the binary file jsonl, if given.
+    Works whose result is in completed (keyed by (source, id)) are not searched again.
+    """
+    results = [None] * len(works)
     ia_found = 0
     ht_found = 0
     gb_found = 0
+    done = 0
 
-    print(f"\n{'=' * 60}")
-    print(f"Searching {len(works)} {source_name} works...")
-    print('=' * 60)
-
+    # Editions of the same work often share title and author; search each
+    # distinct query once and fan the results out to every matching work
+    positions = defaultdict(list)
     for i, work in enumerate(works):
-        print(f"\n[{i+1}/{len(works)}] {work['id']}: {work['title'][:50]}...")
-
-        result = {
-            'id': work['id'],
-            'author': work['author'],
-            'title': work['title'],
-            'date': work['date'],
-            'place': work['place'],
-            'printer': work['printer'],
-            'source': work['source']
-        }
-
-        # Search Internet Archive
-        ia_result = search_internet_archive(work['title'], work['author'])
-        result['internet_archive'] = ia_result
-        if ia_result.get('found'):
-            ia_found += 1
-            print(f"  [IA] {ia_result.get('num_results', 0)} results")
+        previous = (completed or {}).get((work['source'], work['id']))
+        if previous:
+            results[i] = previous
+            done += 1
+            ia_found += bool(previous['internet_archive'].get('found'))
+            ht_found += bool(previous['hathitrust'].get('found'))
+            gb_found += bool(previous['google_books'].get('found'))
         else:
-            print(f"  [IA] not found")
-
-        time.sleep(0.3)
-
-        # Search HathiTrust
-        ht_result = search_hathitrust(work['title'], work['author'])
-        result['hathitrust'] = ht_result
-        if ht_result.get('found'):
-            ht_found += 1
-            print(f"  [HT] {ht_result.get('num_results', 0)} results")
-        else:
-            print(f"  [HT] not found")
-
-        time.sleep(0.3)
-
-        # Search Google Books
-        gb_result = search_google_books(work['title'], work['author'])
-        result['google_books'] = gb_result
-        if gb_result.get('found'):
-            gb_found += 1
-            print(f"  [GB] {gb_result.get('num_results', 0)} results")
-        else:
-            print(f"  [GB] not found")
-
-        results.append(result)
-        time.sleep(0.5)
+            positions[(work['title'], work['author'])].append(i)
+
+    if done:
+        logger.info("%s: %d works resumed from checkpoint", source_name, done)
+    logger.info("Searching %d %s works...", len(works) - done, source_name)
+    remaining = len(works) - done
+    if len(positions) < remaining:
+        logger.info("%s: %d duplicate queries skipped", source_name, remaining - len(positions))
+
+    async def keyed_probe(client, semaphore, key, google_books):
+        return key, await probe(client, semaphore, *key, google_books)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    keys = list(positions)
+    google_books = {}
+    for start in range(0, len(keys), GB_BATCH_SIZE):
+        batch = keys[start:start + GB_BATCH_SIZE]
+        task = asyncio.ensure_future(search_google_books_batch(client, semaphore, batch))
+        google_books.update((key, task) for key in batch)
+
+    tasks = [keyed_probe(client, semaphore, key, google_books[key]) for key in keys]
+
+    # Report works as they finish; results keep the sample order
+    for task in asyncio.as_completed(tasks):
+        key, (ia_result, ht_result, gb_result) = await task
+        for i in positions[key]:
+            work = works[i]
+            result = {
+                'id': work['id'],
+                'author': work['author'],
+                'title': work['title'],
+                'date': work['date'],
+                'place': work['place'],
+                'printer': work['printer'],
+                'source': work['source'],
+                'internet_archive': ia_result,
+                'hathitrust': ht_result,
+                'google_books': gb_result
+            }
+            results[i] = result
+            if jsonl:
+                jsonl.write(dump_json(result) + b'\n')
+                jsonl.flush()
+            done += 1
+
+            ia_found += bool(ia_result.get('found'))
+            ht_found += bool(ht_result.get('found'))
+            gb_found += bool(gb_result.get('found'))
+            logger.info("[%s %d/%d] %s IA=%s HT=%s GB=%s  %s", source_name, done, len(works),
+                        result['id'], describe_search(ia_result), describe_search(ht_result),
+                        describe_search(gb_result), result['title'][:50])
 
     # Calculate any_found
     any_found = sum(1 for r in results if
@@ -301,28 +604,56 @@ def run_experiment_on_sample(works, source_name):
 
     return results, summary
 
+async def run_experiments(samples, jsonl, completed=None):
+    """Run the experiments for all samples concurrently over one HTTP client."""
+    async with make_http_client() as client:
+        return await asyncio.gather(*[
+            run_experiment_on_sample(client, works, source_name, jsonl, completed)
+            for works, source_name in samples
+        ])
+
 def main():
+    global RESPONSE_CACHE
+
+    parser = argparse.ArgumentParser(description='Coverage Experiment v2')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore cached search responses and fetch everything fresh')
+    parser.add_argument('--restart', action='store_true',
+                        help='Discard the checkpoint of an interrupted run instead of resuming it')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("COVERAGE EXPERIMENT V2")
     print("ISTC + USTC from Supabase, Fixed HathiTrust")
     print("=" * 60)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    if not args.no_cache:
+        RESPONSE_CACHE = ResponseCache(CACHE_PATH)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    client = get_supabase_client()
+
     # Sample from ISTC (new seed for fresh sample)
     print("\n--- Sampling from ISTC ---")
-    istc_works = sample_istc_from_supabase(SAMPLE_SIZE, seed=2024)
+    istc_works = sample_istc_from_supabase(SAMPLE_SIZE, seed=2024, client=client)
     print(f"Sampled {len(istc_works)} ISTC works")
 
     # Sample from USTC
     print("\n--- Sampling from USTC ---")
-    ustc_works = sample_ustc_from_supabase(SAMPLE_SIZE, seed=2025)
+    ustc_works = sample_ustc_from_supabase(SAMPLE_SIZE, seed=2025, client=client)
     print(f"Sampled {len(ustc_works)} USTC works")
 
-    # Run experiments
-    istc_results, istc_summary = run_experiment_on_sample(istc_works, "ISTC")
-    ustc_results, ustc_summary = run_experiment_on_sample(ustc_works, "USTC")
+    # Samples are seeded, so an interrupted run's checkpoint covers the same works
+    if args.restart:
+        CHECKPOINT_PATH.unlink(missing_ok=True)
+    completed = load_checkpoint(CHECKPOINT_PATH)
+
+    # Run experiments, checkpointing each result to JSONL as it completes
+    with open(CHECKPOINT_PATH, 'ab') as jsonl:
+        (istc_results, istc_summary), (ustc_results, ustc_summary) = asyncio.run(
+            run_experiments([(istc_works, "ISTC"), (ustc_works, "USTC")], jsonl, completed)
+        )
 
     # Print summaries
     print("\n" + "=" * 60)
@@ -355,8 +686,8 @@ def main():
     }
 
     json_path = OUTPUT_DIR / f"coverage_v2_{timestamp}.json"
-    with open(json_path, 'w') as f:
-        json.dump(output, f, indent=2)
+    json_path.write_bytes(dump_json(output, indent=True))
+    CHECKPOINT_PATH.unlink()
     print(f"\nResults saved to: {json_path}")
 
 if __name__ == "__main__":
@@ -5,30 +5,250 @@ Focuses on 15th-19th century Latin literature, philosophy, science, etc.
 """
 
 import re
+import string
+import sys
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: keyword matching falls back to substring checks
+    ahocorasick = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: batch scores are combined with numpy instead
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+class _PunctuationTable(dict):
+    """
+    str.translate table mapping punctuation to spaces.
+
+    Seeded with string.punctuation less the underscore, a word character. Any
+    other character is classified on first sight as the regex [^\\w\\s] would
+    (so accented letters and Unicode punctuation behave as before) and the
+    answer is kept for later lookups.
+    """
+
+    def __init__(self):
+        super().__init__((ord(c), ' ') for c in string.punctuation if c != '_')
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        value = code if char.isalnum() or char == '_' or char.isspace() else ' '
+        self[code] = value
+        return value
+
+
+@dataclass(slots=True, frozen=True)
+class AuthorProfile:
+    """Neo-Latin profile of a known author."""
+    period: str
+    century: int
+    region: str
+    specialty: str
+    works: Tuple[str, ...]
+    neo_latin_score: float = 0.0
+
+
+# Confidence tier names indexed by the tier codes of combine_scores
+CONFIDENCE_TIERS = np.array(['low', 'medium', 'high'], dtype=object)
+
+# Scores are combined in float32. Every reachable combination of component scores
+# then falls on the same side of these thresholds as its exact decimal value; float64
+# rounding drops a few sums of exactly 0.5 just below the medium tier
+NEO_LATIN_THRESHOLD = np.float32(0.3)
+MEDIUM_THRESHOLD = np.float32(0.5)
+HIGH_THRESHOLD = np.float32(0.7)
+
+
+def combine_score(author: float, title: float, date: float, place: float) -> np.float32:
+    """
+    Combine one work's component scores into its overall Neo-Latin score.
+
+    Author counts double and title one and a half times; date and place are
+    contextual.
+
+    Args:
+        author: Author score
+        title: Title score
+        date: Date likelihood
+        place: Place likelihood
+
+    Returns:
+        float32 score, computed exactly as combine_scores does for a batch
+    """
+    f32 = np.float32
+    return (f32(2.0) * f32(author) + f32(1.5) * f32(title) + f32(date) + f32(place)) * f32(0.25)
+
+
+def _combine_scores_numpy(author: np.ndarray, title: np.ndarray, date: np.ndarray, place: np.ndarray):
+    """Vectorized body of combine_scores."""
+    scores = (np.float32(2.0) * author + np.float32(1.5) * title + date + place) * np.float32(0.25)
+    tiers = np.select([scores >= HIGH_THRESHOLD, scores >= MEDIUM_THRESHOLD], [2, 1], default=0).astype(np.int8)
+    return scores, tiers
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _combine_scores_kernel(author, title, date, place, scores, tiers):
+        """Per-work score and tier loop of combine_scores, parallel over works."""
+        for i in prange(author.shape[0]):
+            score = (np.float32(2.0) * author[i] + np.float32(1.5) * title[i] + date[i] + place[i]) * np.float32(0.25)
+            scores[i] = score
+            tiers[i] = 2 if score >= HIGH_THRESHOLD else 1 if score >= MEDIUM_THRESHOLD else 0
+
+
+def combine_scores(author: np.ndarray, title: np.ndarray, date: np.ndarray, place: np.ndarray):
+    """
+    Combine float32 component score arrays into overall scores and confidence tiers.
+
+    Tiers are 0 (low), 1 (medium) and 2 (high), split at MEDIUM_THRESHOLD and
+    HIGH_THRESHOLD.
+
+    Args:
+        author: Author scores
+        title: Title scores
+        date: Date likelihoods
+        place: Place likelihoods
+
+    Returns:
+        Tuple of (float32 scores, int8 tier codes)
+    """
+    if njit is None:
+        return _combine_scores_numpy(author, title, date, place)
+
+    scores = np.empty(author.shape[0], dtype=np.float32)
+    tiers = np.empty(author.shape[0], dtype=np.int8)
+    _combine_scores_kernel(author, title, date, place, scores, tiers)
+    return scores, tiers
+
 
 class NeoLatinAnalyzer:
     """
     Identifies Neo-Latin works and analyzes their characteristics.
     """
 
+    # Author-name cleanup, built once for every normalize_author_name call
+    _TITLE_CLEAN_RE = re.compile(r'\b(?:mr|dr|prof|sir|frater|dominus|magister)\b\.?')
+    _PUNCT_TABLE = _PunctuationTable()
+
+    # Specific Neo-Latin title characteristics
+    _NEO_LATIN_TITLE_PATTERNS = (
+        r'^de \w+',           # "De" + noun (very common)
+        r'^ad \w+',           # "Ad" + person/thing
+        r'^in \w+',           # "In" + thing
+        r'^commentarii \w+',  # Commentaries
+        r'^dialogus',         # Dialogues
+        r'^epistolae',        # Letters
+        r'^carmina',          # Poems
+        r'^tractatus',        # Treatises
+        r'^disputatio',       # Disputations
+        r'^philosophia',      # Philosophy
+        r'^theologia',        # Theology
+        r'^grammatica',       # Grammar
+        r'^rhetorica',        # Rhetoric
+    )
+
+    # Distinct inputs remembered by the memoized author and work analyses
+    _CACHE_SIZE = 100_000
+
+    # Rows per task when batch title and place matching runs in worker processes
+    _BATCH_CHUNK_ROWS = 5_000
+
+    # Works dated outside these years are only analyzed further if their author or
+    # title points to Neo-Latin
+    _PLAUSIBLE_YEARS = (1200, 1950)
+
+    # Neo-Latin sub-periods as (first year, name, likelihood, historical context);
+    # each runs up to the next one's first year, the last through 1900
+    _NEO_LATIN_PERIODS = (
+        (1300, 'late_medieval', 0.3, ('proto-renaissance', 'early humanism')),
+        (1400, 'early_renaissance', 0.7, ('italian renaissance', 'printing press invention', 'humanism')),
+        (1500, 'high_renaissance', 0.9, ('northern renaissance', 'reformation', 'scientific revolution')),
+        (1600, 'baroque', 0.8, ('scientific revolution', 'baroque culture', 'enlightenment beginnings')),
+        (1700, 'enlightenment', 0.6, ('enlightenment', 'academic latin', 'scientific publications')),
+        (1800, 'late_modern', 0.4, ('academic use', 'declining literary use', 'scientific latin')),
+    )
+
+    @staticmethod
+    def _combine_patterns(patterns, overlapping: bool = False):
+        """
+        Compile patterns into one alternation with a capture group per pattern.
+
+        Args:
+            patterns: Regex source strings
+            overlapping: Wrap the alternation in a lookahead so finditer reports
+                matches starting inside an earlier match
+
+        Returns:
+            Compiled pattern; match.lastindex - 1 indexes the pattern that matched
+        """
+        alternation = '|'.join(f'({p})' for p in patterns)
+        return re.compile(f'(?=(?:{alternation}))' if overlapping else alternation)
+
     def __init__(self):
         """Initialize Neo-Latin analyzer."""
         # Neo-Latin period definition (roughly 14th-19th century)
         self.neo_latin_start_year = 1300
         self.neo_latin_end_year = 1900
 
-        # Known Neo-Latin authors and their periods
-        self.neo_latin_authors = self._load_neo_latin_authors()
+        # Sub-period lookups: by year // 100 for single dates (1900 itself closes
+        # late_modern), and digitize edges with per-bucket tables for whole columns,
+        # where bucket 0 is before the first period and the last is after 1900 or no year
+        self._period_by_hundred = {start // 100: period for start, *period in self._NEO_LATIN_PERIODS}
+        self._period_by_hundred[self.neo_latin_end_year // 100] = self._NEO_LATIN_PERIODS[-1][1:]
+        self._period_edges = [start for start, *_ in self._NEO_LATIN_PERIODS] + [
+            np.nextafter(self.neo_latin_end_year, np.inf)
+        ]
+        self._period_names = np.array([None] + [name for _, name, _, _ in self._NEO_LATIN_PERIODS] + [None])
+        self._period_likelihoods = np.array([0.0] + [p for _, _, p, _ in self._NEO_LATIN_PERIODS] + [0.0],
+                                            dtype=np.float32)
+
+        # Known Neo-Latin authors and their periods, keyed again by normalized name.
+        # Category strings are interned so every result row shares one copy of each
+        self.neo_latin_authors = {
+            known_author: replace(profile, period=sys.intern(profile.period), region=sys.intern(profile.region),
+                                  specialty=sys.intern(profile.specialty))
+            for known_author, profile in self._load_neo_latin_authors().items()
+        }
+        self._norm_authors = {
+            self.normalize_author_name(known_author): (known_author, profile)
+            for known_author, profile in self.neo_latin_authors.items()
+        }
+
+        # Neo-Latin genres and keywords, with each genre's title patterns
+        # fused into one regex so a title is scanned once per genre
+        self.neo_latin_genres = {
+            sys.intern(genre_name): genre_info for genre_name, genre_info in self._load_neo_latin_genres().items()
+        }
+        for genre_info in self.neo_latin_genres.values():
+            genre_info['pattern_re'] = self._combine_patterns(genre_info['patterns'], overlapping=True)
+
+        # Generic title patterns are all anchored prefixes, so at most one matches
+        self._neo_latin_title_re = self._combine_patterns(self._NEO_LATIN_TITLE_PATTERNS)
+
+        # Every genre keyword in one automaton, so a title is scanned once for all of them
+        self._genre_keywords = sorted({
+            keyword for genre_info in self.neo_latin_genres.values() for keyword in genre_info['keywords']
+        })
+        self._keyword_automaton = self._build_automaton(self._genre_keywords)
 
-        # Neo-Latin genres and keywords
-        self.neo_latin_genres = self._load_neo_latin_genres()
+        # Each keyword's genres, with its position in the genre's list for evidence order
+        self._keyword_to_genres = {}
+        for genre_name, genre_info in self.neo_latin_genres.items():
+            for position, keyword in enumerate(genre_info['keywords']):
+                self._keyword_to_genres.setdefault(keyword, []).append((genre_name, position))
 
         # Neo-Latin characteristics and language features
         self.neo_latin_characteristics = self._load_neo_latin_characteristics()
@@ -39,7 +259,78 @@ class NeoLatinAnalyzer:
         # Printing centers (where Neo-Latin works were published)
         self.printing_centers = self._load_printing_centers()
 
-    def _load_neo_latin_authors(self) -> Dict:
+        # Both kinds of center in one automaton, with each list's order kept for evidence
+        self._humanist_rank = {center: i for i, center in enumerate(self.humanist_centers)}
+        self._printing_rank = {center: i for i, center in enumerate(self.printing_centers)}
+        self._center_names = sorted(self._humanist_rank.keys() | self._printing_rank.keys())
+        self._center_automaton = self._build_automaton(self._center_names)
+
+        # Regions by their cities, with cities in one automaton; the first region
+        # listed wins when a place names cities in several
+        self._regions = self._load_regions()
+        self._region_rank = {region: i for i, region in enumerate(self._regions)}
+        self._city_to_region = {city: region for region, cities in self._regions.items() for city in cities}
+        self._city_names = sorted(self._city_to_region)
+        self._city_automaton = self._build_automaton(self._city_names)
+
+        # Catalogs repeat the same authors and editions, so memoize per instance
+        self._lookup_author = lru_cache(maxsize=self._CACHE_SIZE)(self._lookup_author)
+        self._analyze_components = lru_cache(maxsize=self._CACHE_SIZE)(self._analyze_components)
+
+    @staticmethod
+    def _build_automaton(words: List[str]):
+        """
+        Build an Aho-Corasick automaton over words.
+
+        Args:
+            words: Substrings to search for
+
+        Returns:
+            Automaton yielding each word as its value, or None without pyahocorasick
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _find_words(text: str, automaton, words: List[str]) -> Set[str]:
+        """
+        Find which of words occur as substrings of text.
+
+        Args:
+            text: Text to scan
+            automaton: Automaton from _build_automaton over words (or None)
+            words: The automaton's words, used for substring checks without one
+
+        Returns:
+            Set of words found in text
+        """
+        if automaton is None:
+            return {word for word in words if word in text}
+        return {word for _, word in automaton.iter(text)}
+
+    @staticmethod
+    def _coerce_year(year) -> Optional[int]:
+        """
+        Read a publication year as an int.
+
+        Args:
+            year: Year as an int, float or numeric string
+
+        Returns:
+            The year, or None if it is missing or not a number
+        """
+        try:
+            return int(year)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def _load_neo_latin_authors(self) -> Dict[str, AuthorProfile]:
         """
         Load database of major Neo-Latin authors.
 
@@ -48,170 +339,170 @@ class NeoLatinAnalyzer:
         """
         return {
             # Italian Renaissance (14th-16th century)
-            'petrarca, francesco': {
-                'period': 'early_renaissance',
-                'century': 14,
-                'region': 'italy',
-                'specialty': 'humanism',
-                'works': ['canzoniere', 'secretum'],
-                'neo_latin_score': 0.9
-            },
-            'boccaccio, giovanni': {
-                'period': 'early_renaissance',
-                'century': 14,
-                'region': 'italy',
-                'specialty': 'humanism',
-                'works': ['genealogia deorum gentilium'],
-                'neo_latin_score': 0.8
-            },
-            'erasmus, desiderius': {
-                'period': 'northern_renaissance',
-                'century': 16,
-                'region': 'netherlands',
-                'specialty': 'humanism',
-                'works': ['praise of folly', 'colloquies'],
-                'neo_latin_score': 1.0
-            },
-            'thomas more': {
-                'period': 'northern_renaissance',
-                'century': 16,
-                'region': 'england',
-                'specialty': 'humanism',
-                'works': ['utopia'],
-                'neo_latin_score': 0.9
-            },
-            'thomas linacre': {
-                'period': 'northern_renaissance',
-                'century': 16,
-                'region': 'england',
-                'specialty': 'humanism',
-                'works': ['translations of galen'],
-                'neo_latin_score': 0.9
-            },
+            'petrarca, francesco': AuthorProfile(
+                period='early_renaissance',
+                century=14,
+                region='italy',
+                specialty='humanism',
+                works=('canzoniere', 'secretum'),
+                neo_latin_score=0.9
+            ),
+            'boccaccio, giovanni': AuthorProfile(
+                period='early_renaissance',
+                century=14,
+                region='italy',
+                specialty='humanism',
+                works=('genealogia deorum gentilium',),
+                neo_latin_score=0.8
+            ),
+            'erasmus, desiderius': AuthorProfile(
+                period='northern_renaissance',
+                century=16,
+                region='netherlands',
+                specialty='humanism',
+                works=('praise of folly', 'colloquies'),
+                neo_latin_score=1.0
+            ),
+            'thomas more': AuthorProfile(
+                period='northern_renaissance',
+                century=16,
+                region='england',
+                specialty='humanism',
+                works=('utopia',),
+                neo_latin_score=0.9
+            ),
+            'thomas linacre': AuthorProfile(
+                period='northern_renaissance',
+                century=16,
+                region='england',
+                specialty='humanism',
+                works=('translations of galen',),
+                neo_latin_score=0.9
+            ),
 
             # German Humanists
-            'reuchlin, johann': {
-                'period': 'german_renaissance',
-                'century': 15,
-                'region': 'germany',
-                'specialty': 'humanism',
-                'works': ['de rudimentis hebraicis'],
-                'neo_latin_score': 0.9
-            },
-            'wimpfeling, jakob': {
-                'period': 'german_renaissance',
-                'century': 15,
-                'region': 'germany',
-                'specialty': 'humanism',
-                'works': ['germania'],
-                'neo_latin_score': 0.8
-            },
+            'reuchlin, johann': AuthorProfile(
+                period='german_renaissance',
+                century=15,
+                region='germany',
+                specialty='humanism',
+                works=('de rudimentis hebraicis',),
+                neo_latin_score=0.9
+            ),
+            'wimpfeling, jakob': AuthorProfile(
+                period='german_renaissance',
+                century=15,
+                region='germany',
+                specialty='humanism',
+                works=('germania',),
+                neo_latin_score=0.8
+            ),
 
             # Scientists and Philosophers (16th-17th century)
-            'copernicus, nicolaus': {
-                'period': 'scientific_revolution',
-                'century': 16,
-                'region': 'poland',
-                'specialty': 'astronomy',
-                'works': ['de revolutionibus orbium coelestium'],
-                'neo_latin_score': 1.0
-            },
-            'galilei, galileo': {
-                'period': 'scientific_revolution',
-                'century': 17,
-                'region': 'italy',
-                'specialty': 'physics astronomy',
-                'works': ['dialogo', 'discorsi'],
-                'neo_latin_score': 0.9
-            },
-            'kepler, johannes': {
-                'period': 'scientific_revolution',
-                'century': 17,
-                'region': 'germany',
-                'specialty': 'astronomy mathematics',
-                'works': ['astronomia nova', 'harmonices mundi'],
-                'neo_latin_score': 0.9
-            },
-            'descartes, rené': {
-                'period': 'rationalist_philosophy',
-                'century': 17,
-                'region': 'france',
-                'specialty': 'philosophy',
-                'works': ['meditationes', 'principia philosophiae'],
-                'neo_latin_score': 0.8
-            },
-            'spinoza, baruch': {
-                'period': 'rationalist_philosophy',
-                'century': 17,
-                'region': 'netherlands',
-                'specialty': 'philosophy',
-                'works': ['ethica'],
-                'neo_latin_score': 0.9
-            },
+            'copernicus, nicolaus': AuthorProfile(
+                period='scientific_revolution',
+                century=16,
+                region='poland',
+                specialty='astronomy',
+                works=('de revolutionibus orbium coelestium',),
+                neo_latin_score=1.0
+            ),
+            'galilei, galileo': AuthorProfile(
+                period='scientific_revolution',
+                century=17,
+                region='italy',
+                specialty='physics astronomy',
+                works=('dialogo', 'discorsi'),
+                neo_latin_score=0.9
+            ),
+            'kepler, johannes': AuthorProfile(
+                period='scientific_revolution',
+                century=17,
+                region='germany',
+                specialty='astronomy mathematics',
+                works=('astronomia nova', 'harmonices mundi'),
+                neo_latin_score=0.9
+            ),
+            'descartes, rené': AuthorProfile(
+                period='rationalist_philosophy',
+                century=17,
+                region='france',
+                specialty='philosophy',
+                works=('meditationes', 'principia philosophiae'),
+                neo_latin_score=0.8
+            ),
+            'spinoza, baruch': AuthorProfile(
+                period='rationalist_philosophy',
+                century=17,
+                region='netherlands',
+                specialty='philosophy',
+                works=('ethica',),
+                neo_latin_score=0.9
+            ),
 
             # Protestant Reformation
-            'luther, martin': {
-                'period': 'reformation',
-                'century': 16,
-                'region': 'germany',
-                'specialty': 'theology',
-                'works': ['translation of bible', 'ninety-five theses'],
-                'neo_latin_score': 0.9
-            },
-            'calvin, jean': {
-                'period': 'reformation',
-                'century': 16,
-                'region': 'switzerland',
-                'specialty': 'theology',
-                'works': ['institutio christianae religionis'],
-                'neo_latin_score': 0.9
-            },
+            'luther, martin': AuthorProfile(
+                period='reformation',
+                century=16,
+                region='germany',
+                specialty='theology',
+                works=('translation of bible', 'ninety-five theses'),
+                neo_latin_score=0.9
+            ),
+            'calvin, jean': AuthorProfile(
+                period='reformation',
+                century=16,
+                region='switzerland',
+                specialty='theology',
+                works=('institutio christianae religionis',),
+                neo_latin_score=0.9
+            ),
 
             # Catholic Counter-Reformation
-            'bellarmine, robert': {
-                'period': 'counter_reformation',
-                'century': 16,
-                'region': 'italy',
-                'specialty': 'theology',
-                'works': ['disputationes de controversiis'],
-                'neo_latin_score': 0.9
-            },
+            'bellarmine, robert': AuthorProfile(
+                period='counter_reformation',
+                century=16,
+                region='italy',
+                specialty='theology',
+                works=('disputationes de controversiis',),
+                neo_latin_score=0.9
+            ),
 
             # Early Modern Period (17th-18th century)
-            'hugo grotius': {
-                'period': 'early_modern',
-                'century': 17,
-                'region': 'netherlands',
-                'specialty': 'law international',
-                'works': ['de jure belli ac pacis'],
-                'neo_latin_score': 0.9
-            },
-            'samuel von pufendorf': {
-                'period': 'early_modern',
-                'century': 17,
-                'region': 'germany',
-                'specialty': 'law natural',
-                'works': ['de jure naturali et gentium'],
-                'neo_latin_score': 0.8
-            },
+            'hugo grotius': AuthorProfile(
+                period='early_modern',
+                century=17,
+                region='netherlands',
+                specialty='law international',
+                works=('de jure belli ac pacis',),
+                neo_latin_score=0.9
+            ),
+            'samuel von pufendorf': AuthorProfile(
+                period='early_modern',
+                century=17,
+                region='germany',
+                specialty='law natural',
+                works=('de jure naturali et gentium',),
+                neo_latin_score=0.8
+            ),
 
             # 18th Century Enlightenment
-            'christian thomasius': {
-                'period': 'enlightenment',
-                'century': 18,
-                'region': 'germany',
-                'specialty': 'philosophy law',
-                'works': ['institutio philosophiae'],
-                'neo_latin_score': 0.7
-            },
-            'christian wolff': {
-                'period': 'enlightenment',
-                'century': 18,
-                'region': 'germany',
-                'specialty': 'philosophy',
-                'works': ['philosophia rationalis'],
-                'neo_latin_score': 0.8
-            }
+            'christian thomasius': AuthorProfile(
+                period='enlightenment',
+                century=18,
+                region='germany',
+                specialty='philosophy law',
+                works=('institutio philosophiae',),
+                neo_latin_score=0.7
+            ),
+            'christian wolff': AuthorProfile(
+                period='enlightenment',
+                century=18,
+                region='germany',
+                specialty='philosophy',
+                works=('philosophia rationalis',),
+                neo_latin_score=0.8
+            )
         }
 
     def _load_neo_latin_genres(self) -> Dict:
@@ -311,21 +602,41 @@ class NeoLatinAnalyzer:
         Load major Neo-Latin printing centers.
 
         Returns:
-            Dictionary of printing centers with their periods of activity
+            Dictionary of printing centers with their (first, last) years of activity
         """
         return {
-            'venice': {'active': 1469-1700, 'specialty': 'humanist texts', 'printers': ['aldus manutius']},
-            'paris': {'active': 1470-1700, 'specialty': 'humanist theological', 'printers': ['henri estienne']},
-            'lyon': {'active': 1473-1600, 'specialty': 'humanist medical', 'printers': ['sebastian gryphius']},
-            'basel': {'active': 1468-1700, 'specialty': 'reformation texts', 'printers': ['johann froben']},
-            'antwerp': {'active': 1476-1700, 'specialty': 'humanist scientific', 'printers': ['christopher plantin']},
-            'wittenberg': {'active': 1502-1700, 'specialty': 'reformation', 'printers': ['johann rhoes']},
-            'leipzig': {'active': 1481-1700, 'specialty': 'university texts', 'printers': ['jacob thanner']},
-            'oxford': {'active': 1478-1700, 'specialty': 'academic', 'printers': ['theodoric ruding']},
-            'cambridge': {'active': 1521-1700, 'specialty': 'academic', 'printers': ['john Siberch']},
-            'london': {'active': 1476-1700, 'specialty': 'renaissance texts', 'printers': ['william caxton']},
-            'rome': {'active': 1467-1700, 'specialty': 'papal texts', 'printers': ['sweynheim and pannartz']},
-            'florence': {'active': 1471-1700, 'specialty': 'classical texts', 'printers': ['bernardo cennini']}
+            'venice': {'active': (1469, 1700), 'specialty': 'humanist texts', 'printers': ['aldus manutius']},
+            'paris': {'active': (1470, 1700), 'specialty': 'humanist theological', 'printers': ['henri estienne']},
+            'lyon': {'active': (1473, 1600), 'specialty': 'humanist medical', 'printers': ['sebastian gryphius']},
+            'basel': {'active': (1468, 1700), 'specialty': 'reformation texts', 'printers': ['johann froben']},
+            'antwerp': {'active': (1476, 1700), 'specialty': 'humanist scientific', 'printers': ['christopher plantin']},
+            'wittenberg': {'active': (1502, 1700), 'specialty': 'reformation', 'printers': ['johann rhoes']},
+            'leipzig': {'active': (1481, 1700), 'specialty': 'university texts', 'printers': ['jacob thanner']},
+            'oxford': {'active': (1478, 1700), 'specialty': 'academic', 'printers': ['theodoric ruding']},
+            'cambridge': {'active': (1521, 1700), 'specialty': 'academic', 'printers': ['john Siberch']},
+            'london': {'active': (1476, 1700), 'specialty': 'renaissance texts', 'printers': ['william caxton']},
+            'rome': {'active': (1467, 1700), 'specialty': 'papal texts', 'printers': ['sweynheim and pannartz']},
+            'florence': {'active': (1471, 1700), 'specialty': 'classical texts', 'printers': ['bernardo cennini']}
+        }
+
+    def _load_regions(self) -> Dict:
+        """
+        Load the cities that place a publication in each region.
+
+        Returns:
+            Dictionary of region names to city names, in order of precedence
+        """
+        return {
+            'italy': ['roma', 'venezia', 'firenze', 'napoli', 'milano', 'bologna', 'padova'],
+            'france': ['paris', 'lyon', 'bordeaux', 'toulouse', 'rouen'],
+            'germany': ['leipzig', 'wittenberg', 'heidelberg', 'ingolstadt', 'tübingen', 'nürnberg'],
+            'netherlands': ['amsterdam', 'leiden', 'antwerp', 'brugge'],
+            'england': ['london', 'oxford', 'cambridge', 'cantuaria'],
+            'spain': ['madrid', 'salamanca', 'alcalá', 'barcelona'],
+            'portugal': ['lisboa', 'coimbra'],
+            'switzerland': ['genève', 'basel', 'zürich'],
+            'poland': ['cracovia', 'warszawa'],
+            'scandinavia': ['copenhagen', 'uppsala', 'stockholm']
         }
 
     def normalize_author_name(self, author: str) -> str:
@@ -345,13 +656,12 @@ class NeoLatinAnalyzer:
         author = str(author).lower().strip()
 
         # Remove common title words
-        author = re.sub(r'\b(?:mr|dr|prof|sir|frater|dominus|magister)\b\.?', '', author)
+        author = self._TITLE_CLEAN_RE.sub('', author)
 
         # Remove punctuation and extra spaces
-        author = re.sub(r'[^\w\s]', ' ', author)
-        author = re.sub(r'\s+', ' ', author)
+        author = author.translate(self._PUNCT_TABLE)
 
-        return author.strip()
+        return ' '.join(author.split())
 
     def analyze_publication_date(self, year: int) -> Dict:
         """
@@ -363,6 +673,7 @@ class NeoLatinAnalyzer:
         Returns:
             Dictionary with Neo-Latin period analysis
         """
+        year = self._coerce_year(year)
         result = {
             'neo_latin_period': False,
             'period_name': 'unknown',
@@ -382,30 +693,10 @@ class NeoLatinAnalyzer:
             result['neo_latin_period'] = True
 
             # Determine specific period
-            if 1300 <= year < 1400:
-                result['period_name'] = 'late_medieval'
-                result['neo_latin_likelihood'] = 0.3
-                result['historical_context'] = ['proto-renaissance', 'early humanism']
-            elif 1400 <= year < 1500:
-                result['period_name'] = 'early_renaissance'
-                result['neo_latin_likelihood'] = 0.7
-                result['historical_context'] = ['italian renaissance', 'printing press invention', 'humanism']
-            elif 1500 <= year < 1600:
-                result['period_name'] = 'high_renaissance'
-                result['neo_latin_likelihood'] = 0.9
-                result['historical_context'] = ['northern renaissance', 'reformation', 'scientific revolution']
-            elif 1600 <= year < 1700:
-                result['period_name'] = 'baroque'
-                result['neo_latin_likelihood'] = 0.8
-                result['historical_context'] = ['scientific revolution', 'baroque culture', 'enlightenment beginnings']
-            elif 1700 <= year < 1800:
-                result['period_name'] = 'enlightenment'
-                result['neo_latin_likelihood'] = 0.6
-                result['historical_context'] = ['enlightenment', 'academic latin', 'scientific publications']
-            elif 1800 <= year <= 1900:
-                result['period_name'] = 'late_modern'
-                result['neo_latin_likelihood'] = 0.4
-                result['historical_context'] = ['academic use', 'declining literary use', 'scientific latin']
+            period = self._period_by_hundred.get(year // 100)
+            if period:
+                result['period_name'], result['neo_latin_likelihood'], context = period
+                result['historical_context'] = list(context)
         else:
             # Outside Neo-Latin period
             if year < self.neo_latin_start_year:
@@ -417,6 +708,36 @@ class NeoLatinAnalyzer:
 
         return result
 
+    def _match_author(self, norm_author: str) -> Optional[Tuple[str, AuthorProfile]]:
+        """
+        Find the known Neo-Latin author for a normalized name.
+
+        Args:
+            norm_author: Name as returned by normalize_author_name
+
+        Returns:
+            (known_author, profile), or None if no known author matches
+        """
+        # Exact match first, then partial match
+        match = self._norm_authors.get(norm_author)
+        if match is None:
+            for norm_known, known in self._norm_authors.items():
+                if norm_known in norm_author or norm_author in norm_known:
+                    return known
+        return match
+
+    def _lookup_author(self, author: str) -> Optional[Tuple[str, AuthorProfile]]:
+        """
+        Normalize an author name and find the known Neo-Latin author it names.
+
+        Args:
+            author: Author name
+
+        Returns:
+            (known_author, profile), or None if no known author matches
+        """
+        return self._match_author(self.normalize_author_name(author))
+
     def analyze_author(self, author: str) -> Dict:
         """
         Analyze author for Neo-Latin characteristics.
@@ -440,18 +761,18 @@ class NeoLatinAnalyzer:
         if not author:
             return result
 
-        norm_author = self.normalize_author_name(author)
-
         # Check against known Neo-Latin authors
-        for known_author, author_info in self.neo_latin_authors.items():
-            norm_known = self.normalize_author_name(known_author)
-
-            # Check for exact match or partial match
-            if norm_author == norm_known or norm_known in norm_author or norm_author in norm_known:
-                result.update(author_info)
-                result['neo_latin_author'] = True
-                result['evidence'].append(f"Known Neo-Latin author: {known_author}")
-                break
+        match = self._lookup_author(author)
+        if match is not None:
+            known_author, profile = match
+            result['period'] = profile.period
+            result['century'] = profile.century
+            result['region'] = profile.region
+            result['specialty'] = profile.specialty
+            result['works'] = list(profile.works)
+            result['neo_latin_score'] = profile.neo_latin_score
+            result['neo_latin_author'] = True
+            result['evidence'].append(f"Known Neo-Latin author: {known_author}")
 
         return result
 
@@ -476,7 +797,12 @@ class NeoLatinAnalyzer:
         if not title:
             return result
 
-        title_lower = title.lower()
+        title_lower = str(title).lower()
+        # Route each keyword found to the genres it marks
+        keyword_hits = {}
+        for keyword in self._find_words(title_lower, self._keyword_automaton, self._genre_keywords):
+            for genre_name, position in self._keyword_to_genres[keyword]:
+                keyword_hits.setdefault(genre_name, []).append((position, keyword))
 
         # Check for Neo-Latin title patterns
         for genre_name, genre_info in self.neo_latin_genres.items():
@@ -484,43 +810,27 @@ class NeoLatinAnalyzer:
             pattern_matches = 0
 
             # Check keywords
-            for keyword in genre_info['keywords']:
-                if keyword in title_lower:
-                    genre_matches += 1
-                    result['evidence'].append(f"Genre keyword '{keyword}' found")
+            for _, keyword in sorted(keyword_hits.get(genre_name, ())):
+                genre_matches += 1
+                result['evidence'].append(f"Genre keyword '{keyword}' found")
 
             # Check patterns
-            for pattern in genre_info['patterns']:
-                if re.search(pattern, title_lower):
-                    pattern_matches += 1
-                    result['neo_latin_patterns'].append(pattern)
-                    result['evidence'].append(f"Genre pattern '{pattern}' matched")
+            matched = {m.lastindex for m in genre_info['pattern_re'].finditer(title_lower)}
+            for group in sorted(matched):
+                pattern = genre_info['patterns'][group - 1]
+                pattern_matches += 1
+                result['neo_latin_patterns'].append(pattern)
+                result['evidence'].append(f"Genre pattern '{pattern}' matched")
 
             if genre_matches > 0 or pattern_matches > 0:
                 result['genre_suggestions'].append(genre_name)
                 result['neo_latin_indicators'] += (genre_matches + pattern_matches)
 
         # Specific Neo-Latin title characteristics
-        neo_latin_patterns = [
-            r'^de \w+',           # "De" + noun (very common)
-            r'^ad \w+',           # "Ad" + person/thing
-            r'^in \w+',           # "In" + thing
-            r'^commentarii \w+',  # Commentaries
-            r'^dialogus',         # Dialogues
-            r'^epistolae',        # Letters
-            r'^carmina',          # Poems
-            r'^tractatus',        # Treatises
-            r'^disputatio',       # Disputations
-            r'^philosophia',      # Philosophy
-            r'^theologia',        # Theology
-            r'^grammatica',       # Grammar
-            r'^rhetorica',        # Rhetoric
-        ]
-
-        for pattern in neo_latin_patterns:
-            if re.search(pattern, title_lower):
-                result['neo_latin_indicators'] += 1
-                result['neo_latin_patterns'].append(pattern)
+        match = self._neo_latin_title_re.match(title_lower)
+        if match:
+            result['neo_latin_indicators'] += 1
+            result['neo_latin_patterns'].append(self._NEO_LATIN_TITLE_PATTERNS[match.lastindex - 1])
 
         # Calculate Neo-Latin score
         if result['neo_latin_indicators'] >= 2:
@@ -531,12 +841,13 @@ class NeoLatinAnalyzer:
 
         return result
 
-    def analyze_publication_place(self, place: str) -> Dict:
+    def analyze_publication_place(self, place: str, year: int = None) -> Dict:
         """
         Analyze publication place for Neo-Latin characteristics.
 
         Args:
             place: Publication place
+            year: Publication year, to check printing centers were active
 
         Returns:
             Dictionary with place Neo-Latin analysis
@@ -554,54 +865,68 @@ class NeoLatinAnalyzer:
             return result
 
         place_lower = str(place).lower().strip()
+        centers_found = self._find_words(place_lower, self._center_automaton, self._center_names)
+
+        # Centers named in the place; failing that, centers whose name contains the
+        # place (abbreviations). No center name contains another, so a place never
+        # matches both ways
+        humanist_hits = sorted((c for c in centers_found if c in self._humanist_rank), key=self._humanist_rank.get)
+        if not humanist_hits:
+            humanist_hits = [center for center in self.humanist_centers if place_lower in center]
+
+        printing_hits = sorted((c for c in centers_found if c in self._printing_rank), key=self._printing_rank.get)
+        if not printing_hits:
+            printing_hits = [center for center in self.printing_centers if place_lower in center]
 
         # Check humanist centers
-        for center in self.humanist_centers:
-            if center in place_lower or place_lower in center:
-                result['humanist_center'] = True
-                result['neo_latin_likelihood'] += 0.3
-                result['evidence'].append(f"Humanist center: {center}")
-
-        # Check printing centers
-        for center, info in self.printing_centers.items():
-            if center in place_lower or place_lower in center:
-                result['printing_center'] = True
-                result['neo_latin_likelihood'] += 0.4
-                result['evidence'].append(f"Major printing center: {center} ({info['specialty']})")
-
-                # Check if active during Neo-Latin period
-                if isinstance(info['active'], tuple):
-                    start, end = info['active']
-                else:
-                    start, end = info['active'].split('-')
-                    start, end = int(start), int(end)
-
-                # (Would need year parameter to check active period)
+        for center in humanist_hits:
+            result['humanist_center'] = True
+            result['neo_latin_likelihood'] += 0.3
+            result['evidence'].append(f"Humanist center: {center}")
+
+        # Check printing centers, counting only those active in the publication year if known
+        year = self._coerce_year(year)
+        for center in printing_hits:
+            info = self.printing_centers[center]
+            start, end = info['active']
+            if year and not start <= year <= end:
+                continue
 
-        # Determine region
-        regions = {
-            'italy': ['roma', 'venezia', 'firenze', 'napoli', 'milano', 'bologna', 'padova'],
-            'france': ['paris', 'lyon', 'bordeaux', 'toulouse', 'rouen'],
-            'germany': ['leipzig', 'wittenberg', 'heidelberg', 'ingolstadt', 'tübingen', 'nürnberg'],
-            'netherlands': ['amsterdam', 'leiden', 'antwerp', 'brugge'],
-            'england': ['london', 'oxford', 'cambridge', 'cantuaria'],
-            'spain': ['madrid', 'salamanca', 'alcalá', 'barcelona'],
-            'portugal': ['lisboa', 'coimbra'],
-            'switzerland': ['genève', 'basel', 'zürich'],
-            'poland': ['cracovia', 'warszawa'],
-            'scandinavia': ['copenhagen', 'uppsala', 'stockholm']
-        }
+            result['printing_center'] = True
+            result['neo_latin_likelihood'] += 0.4
+            result['evidence'].append(f"Major printing center: {center} ({info['specialty']})")
 
-        for region, cities in regions.items():
-            if any(city in place_lower for city in cities):
-                result['region'] = region
-                break
+        # Determine region
+        cities_found = self._find_words(place_lower, self._city_automaton, self._city_names)
+        if cities_found:
+            result['region'] = min((self._city_to_region[city] for city in cities_found), key=self._region_rank.get)
 
         if result['humanist_center'] or result['printing_center']:
             result['neo_latin_center'] = True
 
         return result
 
+    def _analyze_components(self, title: str, author: str, year: int, place: str) -> Tuple[Dict, Dict, Dict, Dict]:
+        """
+        Run the author, title, date and place analyses for one work.
+
+        Results are memoized, so callers must copy them before handing them out.
+
+        Returns:
+            Tuple of (author, title, date, place) analysis dictionaries
+        """
+        return (
+            self.analyze_author(author),
+            self.analyze_title(title),
+            self.analyze_publication_date(year),
+            self.analyze_publication_place(place, year),
+        )
+
+    @staticmethod
+    def _copy_analysis(analysis: Dict) -> Dict:
+        """Copy an analysis dictionary and its lists, leaving the memoized one untouched."""
+        return {key: list(value) if isinstance(value, list) else value for key, value in analysis.items()}
+
     def is_neo_latin_work(self, title: str, author: str, year: int = None, place: str = None) -> Dict:
         """
         Comprehensive Neo-Latin work analysis.
@@ -628,12 +953,19 @@ class NeoLatinAnalyzer:
             'genre': 'unknown',
             'characteristics': {}
         }
+        year = self._coerce_year(year)
+
+        # Out-of-period works with no known author and no Neo-Latin title stay
+        # low-scoring whatever their place, so skip the remaining analyses
+        if year and not self._PLAUSIBLE_YEARS[0] <= year <= self._PLAUSIBLE_YEARS[1]:
+            if ((not author or self._lookup_author(author) is None)
+                    and not self.analyze_title(title)['neo_latin_indicators']):
+                return result
 
         # Analyze each component
-        author_analysis = self.analyze_author(author)
-        title_analysis = self.analyze_title(title)
-        date_analysis = self.analyze_publication_date(year)
-        place_analysis = self.analyze_publication_place(place)
+        author_analysis, title_analysis, date_analysis, place_analysis = (
+            self._copy_analysis(analysis) for analysis in self._analyze_components(title, author, year, place)
+        )
 
         result['characteristics'] = {
             'author': author_analysis,
@@ -643,23 +975,23 @@ class NeoLatinAnalyzer:
         }
 
         # Calculate overall Neo-Latin score
-        scores = [
-            author_analysis.get('neo_latin_score', 0.0) * 2.0,  # Author is most important
-            title_analysis.get('neo_latin_score', 0.0) * 1.5,  # Title is important
-            date_analysis.get('neo_latin_likelihood', 0.0),       # Date is contextual
-            place_analysis.get('neo_latin_likelihood', 0.0)       # Place is contextual
-        ]
+        score = combine_score(
+            author_analysis.get('neo_latin_score', 0.0),  # Author is most important
+            title_analysis.get('neo_latin_score', 0.0),  # Title is important
+            date_analysis.get('neo_latin_likelihood', 0.0),  # Date is contextual
+            place_analysis.get('neo_latin_likelihood', 0.0)  # Place is contextual
+        )
 
-        result['neo_latin_score'] = sum(scores) / len(scores)
+        result['neo_latin_score'] = float(score)
 
         # Determine if it's Neo-Latin
-        if result['neo_latin_score'] >= 0.7:
+        if score >= HIGH_THRESHOLD:
             result['is_neo_latin'] = True
             result['confidence'] = 'high'
-        elif result['neo_latin_score'] >= 0.5:
+        elif score >= MEDIUM_THRESHOLD:
             result['is_neo_latin'] = True
             result['confidence'] = 'medium'
-        elif result['neo_latin_score'] >= 0.3:
+        elif score >= NEO_LATIN_THRESHOLD:
             result['is_neo_latin'] = True
             result['confidence'] = 'low'
 
@@ -680,13 +1012,69 @@ class NeoLatinAnalyzer:
 
         return result
 
-    def batch_analyze_neo_latin(self, works_df: pd.DataFrame, limit: int = None) -> pd.DataFrame:
+    def _analyze_title_place_rows(self, titles: np.ndarray, years: np.ndarray, places: np.ndarray,
+                                  known_authors: np.ndarray, offset: int = 0) -> Tuple[np.ndarray, ...]:
+        """
+        Run title and place analysis for rows of a batch into result columns.
+
+        Args:
+            titles: Work titles
+            years: Numeric publication years (NaN if unknown)
+            places: Publication places
+            known_authors: Matched known author per row, or None
+            offset: Position of the first row in the whole batch, for progress logging
+
+        Returns:
+            Tuple of (title scores, place scores, Neo-Latin center flags, genres,
+            title genres, evidence counts, evidence) arrays
+        """
+        n = len(titles)
+        title_scores = np.zeros(n, dtype=np.float32)
+        place_scores = np.zeros(n, dtype=np.float32)
+        neo_latin_center = np.zeros(n, dtype=bool)
+        evidence_counts = np.zeros(n, dtype=np.int64)
+        genres, title_genres, evidence = (np.full(n, None, dtype=object) for _ in range(3))
+
+        for i, (title, year, place, known_author) in enumerate(zip(titles, years, places, known_authors)):
+            title_analysis = self.analyze_title(title)
+            place_analysis = self.analyze_publication_place(place, year)
+
+            author_evidence = ()
+            if known_author is not None:
+                author_evidence = ("Known Neo-Latin author", f"Known Neo-Latin author: {known_author}")
+
+            title_scores[i] = title_analysis['neo_latin_score']
+            place_scores[i] = place_analysis['neo_latin_likelihood']
+            neo_latin_center[i] = place_analysis['neo_latin_center']
+
+            genre_suggestions = title_analysis['genre_suggestions']
+            genres[i] = genre_suggestions[0] if genre_suggestions else 'unknown'
+            if genre_suggestions:
+                title_genres[i] = sys.intern('; '.join(genre_suggestions))
+
+            # Count all evidence but only join the first five, without building a combined list
+            work_evidence = (author_evidence, title_analysis['evidence'], place_analysis['evidence'])
+            evidence_counts[i] = sum(map(len, work_evidence))
+            evidence[i] = sys.intern('; '.join(islice(chain.from_iterable(work_evidence), 5)))
+
+            # Progress logging
+            if (offset + i + 1) % 50 == 0:
+                logger.info(f"Analyzed {offset + i + 1} works for Neo-Latin characteristics")
+
+        return title_scores, place_scores, neo_latin_center, genres, title_genres, evidence_counts, evidence
+
+    def batch_analyze_neo_latin(self, works_df: pd.DataFrame, limit: int = None, workers: int = 1) -> pd.DataFrame:
         """
         Analyze a batch of works for Neo-Latin characteristics.
 
+        Dates, author names, scores and confidence tiers are computed for whole
+        columns at once; title and place matching run per row, in worker
+        processes when asked for.
+
         Args:
             works_df: DataFrame of works to analyze
             limit: Maximum number of works to analyze (None for all)
+            workers: Processes for title and place matching (1 keeps it in this process)
 
         Returns:
             DataFrame with Neo-Latin analysis added
@@ -694,86 +1082,134 @@ class NeoLatinAnalyzer:
         if limit:
             works_df = works_df.head(limit)
 
-        neo_latin_results = []
-
         logger.info(f"Analyzing {len(works_df)} works for Neo-Latin characteristics")
 
-        for idx, work in works_df.iterrows():
-            title = work.get('title', '')
-            author = work.get('author', '')
-            year = work.get('publication_year')
-            place = work.get('publication_place')
-
-            if not title:
-                logger.warning(f"Skipping record {idx} - no title")
-                continue
+        missing = pd.Series(None, index=works_df.index, dtype=object)
+        has_title = works_df.get('title', missing).fillna('').astype(bool)
+        for idx in works_df.index[~has_title]:
+            logger.warning(f"Skipping record {idx} - no title")
+        works_df = works_df[has_title]
+        missing = missing[has_title]
+
+        titles = works_df.get('title', missing)
+        authors = works_df.get('author', missing.fillna(''))
+        years = works_df.get('publication_year', missing)
+        places = works_df.get('publication_place', missing)
+
+        # Date stage: bucket every year at once and read names and likelihoods by bucket
+        year_values = pd.to_numeric(years, errors='coerce').to_numpy(dtype=float)
+        buckets = np.digitize(year_values, self._period_edges)
+        date_periods = self._period_names[buckets]
+        date_scores = self._period_likelihoods[buckets]
+        in_period = (buckets > 0) & (buckets < len(self._period_edges))
+
+        # Author stage: normalize the whole column at once (as normalize_author_name
+        # does), resolve exact names by dict lookup and partial-match each remaining
+        # distinct name once
+        author_text = authors.fillna('')
+        has_author = author_text.astype(bool)
+        norm_authors = (author_text.astype(str).str.lower()
+                        .str.replace(self._TITLE_CLEAN_RE, '', regex=True)
+                        .str.translate(self._PUNCT_TABLE)
+                        .str.split()
+                        .str.join(' '))
+        author_matches = norm_authors.map(self._norm_authors)
+        misses = author_matches.isna() & has_author
+        partial = {name: self._match_author(name) for name in norm_authors[misses].unique()}
+        author_matches = author_matches.where(~misses, norm_authors.map(partial))
+
+        # Known-author columns from the matched profiles
+        n = len(works_df)
+        known_authors, author_periods, author_specialties, author_regions = (
+            np.full(n, None, dtype=object) for _ in range(4)
+        )
+        author_scores = np.zeros(n, dtype=np.float32)
+        for i, author_match in enumerate(author_matches):
+            if isinstance(author_match, tuple):
+                known_authors[i], profile = author_match
+                author_scores[i] = profile.neo_latin_score
+                author_periods[i] = profile.period
+                author_specialties[i] = profile.specialty
+                author_regions[i] = profile.region
+
+        # Title and place matching per row, split across worker processes for big batches
+        rows = (titles.to_numpy(), year_values, places.to_numpy(), known_authors)
+        if workers > 1 and n > self._BATCH_CHUNK_ROWS:
+            chunks = [
+                (*(column[start:start + self._BATCH_CHUNK_ROWS] for column in rows), start)
+                for start in range(0, n, self._BATCH_CHUNK_ROWS)
+            ]
+            # Spawned rather than forked: the numba scoring kernel's thread pool
+            # does not survive a fork
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_batch_worker, initargs=(type(self),)) as executor:
+                parts = list(executor.map(_analyze_batch_chunk, chunks))
+            row_columns = [np.concatenate(column) for column in zip(*parts)]
+        else:
+            row_columns = self._analyze_title_place_rows(*rows)
+        title_scores, place_scores, neo_latin_center, genres, title_genres, evidence_counts, evidence = row_columns
+
+        # Weighted score and confidence tiers for the whole batch; indexing the
+        # object-dtype tier names keeps one shared str per tier
+        scores, tiers = combine_scores(author_scores, title_scores, date_scores, place_scores)
+        confidence = CONFIDENCE_TIERS[tiers]
+
+        period = np.where(in_period, date_periods, author_periods)
+        period[pd.isna(period)] = 'unknown'
+
+        columns = {
+            'title': titles.to_numpy(),
+            'author': authors.to_numpy(),
+            'year': years.to_numpy(),
+            'place': places.to_numpy(),
+            'is_neo_latin': scores >= NEO_LATIN_THRESHOLD,
+            'neo_latin_score': scores,
+            'confidence': confidence,
+            'period': period,
+            'genre': genres,
+            'evidence_count': evidence_counts,
+            'evidence': evidence,
+            'author_period': author_periods,
+            'author_specialty': author_specialties,
+            'author_region': author_regions,
+            'title_genres': title_genres,
+            'date_period': np.where(in_period, date_periods, None),
+            'neo_latin_center': np.where(neo_latin_center, True, None),
+        }
 
-            try:
-                neo_latin_analysis = self.is_neo_latin_work(title, author, year, place)
-
-                # Flatten analysis results for DataFrame
-                flattened = {
-                    'title': title,
-                    'author': author,
-                    'year': year,
-                    'place': place,
-                    'is_neo_latin': neo_latin_analysis['is_neo_latin'],
-                    'neo_latin_score': neo_latin_analysis['neo_latin_score'],
-                    'confidence': neo_latin_analysis['confidence'],
-                    'period': neo_latin_analysis['period'],
-                    'genre': neo_latin_analysis['genre'],
-                    'evidence_count': len(neo_latin_analysis['evidence']),
-                    'evidence': '; '.join(neo_latin_analysis['evidence'][:5])  # Limit evidence
-                }
-
-                # Add author-specific info
-                if neo_latin_analysis['characteristics']['author'].get('neo_latin_author'):
-                    flattened['author_period'] = neo_latin_analysis['characteristics']['author'].get('period', 'unknown')
-                    flattened['author_specialty'] = neo_latin_analysis['characteristics']['author'].get('specialty', 'unknown')
-                    flattened['author_region'] = neo_latin_analysis['characteristics']['author'].get('region', 'unknown')
-
-                # Add title-specific info
-                if neo_latin_analysis['characteristics']['title'].get('genre_suggestions'):
-                    flattened['title_genres'] = '; '.join(neo_latin_analysis['characteristics']['title']['genre_suggestions'])
-
-                # Add date-specific info
-                if neo_latin_analysis['characteristics']['date'].get('neo_latin_period'):
-                    flattened['date_period'] = neo_latin_analysis['characteristics']['date']['period_name']
-
-                # Add place-specific info
-                if neo_latin_analysis['characteristics']['place'].get('neo_latin_center'):
-                    flattened['neo_latin_center'] = True
-
-                neo_latin_results.append(flattened)
-
-                # Progress logging
-                if (len(neo_latin_results) % 50 == 0):
-                    logger.info(f"Analyzed {len(neo_latin_results)} works for Neo-Latin characteristics")
-
-            except Exception as e:
-                logger.error(f"Error analyzing Neo-Latin for record {idx}: {e}")
-                # Add result with error status
-                neo_latin_results.append({
-                    'title': title,
-                    'author': author,
-                    'is_neo_latin': False,
-                    'neo_latin_score': 0.0,
-                    'confidence': 'error',
-                    'error': str(e)
-                })
-
-        # Convert to DataFrame
-        neo_latin_df = pd.DataFrame(neo_latin_results)
+        # Detail columns only appear when some row has a value, as before
+        optional = ['author_period', 'author_specialty', 'author_region', 'title_genres', 'date_period',
+                    'neo_latin_center']
+        neo_latin_df = pd.DataFrame({
+            name: column for name, column in columns.items()
+            if name not in optional or pd.notna(column).any()
+        })
 
         logger.info(f"Neo-Latin analysis complete for {len(neo_latin_df)} works")
 
-        # Generate summary statistics
+        # Generate summary statistics; both tables come from one grouping
         if not neo_latin_df.empty:
-            neo_latin_counts = neo_latin_df['is_neo_latin'].value_counts()
+            summary = neo_latin_df.groupby(['is_neo_latin', 'confidence']).size()
+            neo_latin_counts = summary.groupby(level='is_neo_latin').sum().sort_values(ascending=False)
             logger.info(f"Neo-Latin summary: {neo_latin_counts.to_dict()}")
 
-            if neo_latin_df['is_neo_latin'].any():
-                confidence_counts = neo_latin_df[neo_latin_df['is_neo_latin']]['confidence'].value_counts()
+            if True in neo_latin_counts.index:
+                confidence_counts = summary.loc[True].sort_values(ascending=False)
                 logger.info(f"Confidence breakdown: {confidence_counts.to_dict()}")
 
-        return neo_latin_df
\ No newline at end of file
+        return neo_latin_df
+
+
+# Analyzer reused by every chunk a batch worker process handles
+_worker_analyzer = None
+
+
+def _init_batch_worker(analyzer_class):
+    """Create the analyzer for a batch worker process."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class()
+
+
+def _analyze_batch_chunk(chunk):
+    """Run title and place analysis for one chunk of batch rows in a worker process."""
+    return _worker_analyzer._analyze_title_place_rows(*chunk)
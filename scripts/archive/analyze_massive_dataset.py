@@ -3,12 +3,44 @@
 Analyze the massive 9,000 book Internet Archive Latin dataset
 """
 
+import numpy as np
 import pandas as pd
 import json
 import re
 from datetime import datetime
 import collections
 
+try:
+    import orjson
+except ImportError:  # Optional: results are written with the stdlib json module
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional: text columns keep pandas' default string storage
+    pyarrow = None
+
+# Arrow-backed strings for the searched text columns, with NaN for missing values
+# as in pandas' default str dtype
+TEXT_COLUMNS = ['title', 'creator', 'language']
+TEXT_DTYPES = {column: pd.StringDtype('pyarrow', na_value=np.nan) for column in TEXT_COLUMNS} if pyarrow else {}
+
+# Columns the analysis reads; the rest of each CSV is never loaded
+ANALYSIS_COLUMNS = ['identifier', 'title', 'creator', 'year', 'language']
+
+# Rows read per chunk, so only one chunk of a CSV is in memory at a time
+CSV_CHUNK_SIZE = 50_000
+
+def write_json(path, data):
+    """Write data as indented UTF-8 JSON, using orjson (with numpy scalars) when available."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=lambda value: value.item())
+
 def analyze_massive_latin_dataset():
     """Analyze the massive Latin books collection"""
 
@@ -22,44 +54,44 @@ def analyze_massive_latin_dataset():
         'data/internet_archive_latin_books_20251119_091000.csv'
     ]
 
-    all_records = []
+    # Read in chunks, dropping records without an identifier and repeats within a
+    # chunk as they arrive; a file contributes nothing unless it loads completely
+    frames = []
     for csv_file in csv_files:
         try:
-            df = pd.read_csv(csv_file)
-            print(f"📂 Loaded {len(df)} records from {csv_file}")
-            all_records.extend(df.to_dict('records'))
+            file_frames = []
+            loaded = 0
+            chunks = pd.read_csv(csv_file, usecols=lambda column: column in ANALYSIS_COLUMNS,
+                                 dtype={'identifier': 'string', **TEXT_DTYPES}, chunksize=CSV_CHUNK_SIZE)
+            for chunk in chunks:
+                loaded += len(chunk)
+                ids = chunk['identifier']
+                file_frames.append(chunk[ids.notna() & ~ids.duplicated()])
+            print(f"📂 Loaded {loaded} records from {csv_file}")
+            frames.extend(file_frames)
         except Exception as e:
             print(f"⚠️  Could not load {csv_file}: {e}")
 
-    # Remove duplicates by identifier
-    unique_records = {}
-    for record in all_records:
-        identifier = record.get('identifier', '')
-        if identifier and identifier not in unique_records:
-            unique_records[identifier] = record
-
-    df = pd.DataFrame.from_dict(unique_records, orient='index')
+    # Keep the first record for each identifier across chunks and files
+    df = pd.concat(frames, ignore_index=True)
+    df = df[~df.duplicated(subset='identifier', keep='first')]
     print(f"\n📊 After deduplication: {len(df)} unique records")
 
-    # Clean and analyze years
-    def extract_year(year_str):
-        if pd.isna(year_str) or year_str == '':
-            return None
-        year_match = re.search(r'(\d{4})', str(year_str))
-        return int(year_match.group(1)) if year_match else None
-
-    df['clean_year'] = df['year'].apply(extract_year)
-    df = df.dropna(subset=['clean_year'])
-
-    # Filter to our period
-    df = df[(df['clean_year'] >= 1450) & (df['clean_year'] <= 1700)]
+    # Clean years and filter to our period in a single selection
+    years = df['year'].astype('string').str.extract(r'(\d{4})', expand=False).astype('Int64')
+    in_period = years.between(1450, 1700).fillna(False).astype(bool)
+    df = df[in_period].assign(clean_year=years[in_period].astype('int64'))
     print(f"📅 Filtered to {len(df)} records from 1450-1700")
 
+    # Lowercase the searched columns once for every pattern below
+    title_lc = df['title'].str.lower()
+    creator_lc = df['creator'].str.lower()
+
     # COMPREHENSIVE ANALYSIS
     print(f"\n📈 COMPREHENSIVE ANALYSIS")
 
     # Century distribution
-    century_counts = df.groupby(df['clean_year'] // 100 * 100).size().sort_index()
+    century_counts = (df['clean_year'] // 100 * 100).value_counts(sort=False).sort_index()
     print(f"\n📖 Books by Century:")
     for century in sorted(century_counts.index):
         count = century_counts[century]
@@ -74,7 +106,7 @@ def analyze_massive_latin_dataset():
         print(f"  {century_name}: {count:,} books ({percentage:.1f}%)")
 
     # Decade distribution for detailed view
-    decade_counts = df.groupby(df['clean_year'] // 10 * 10).size().sort_index()
+    decade_counts = (df['clean_year'] // 10 * 10).value_counts(sort=False).sort_index()
     print(f"\n📊 Top Decades:")
     for decade, count in decade_counts.tail(10).items():
         print(f"  {decade}s: {count:,} books")
@@ -99,19 +131,21 @@ def analyze_massive_latin_dataset():
     author_stats = {}
     total_famous_works = 0
 
+    titles = df['title'].to_numpy()
     for category, authors in famous_authors.items():
         print(f"\n  {category.upper()}:")
         category_found = 0
         for author in authors:
-            matching = df[df['creator'].str.lower().str.contains(author, na=False)]
-            count = len(matching)
+            # Count from the mask and take sample titles by position, without selecting the matching rows
+            matching = creator_lc.str.contains(author, na=False).to_numpy()
+            count = int(matching.sum())
             if count > 0:
                 category_found += count
                 total_famous_works += count
                 author_stats[author] = {
                     'count': count,
                     'category': category,
-                    'works': matching.head(3)['title'].tolist()
+                    'works': titles[np.flatnonzero(matching)[:3]].tolist()
                 }
                 print(f"    {author.title()}: {count} works")
 
@@ -136,11 +170,10 @@ def analyze_massive_latin_dataset():
         'Rhetoric': ['oratio', 'declamatio', 'institutio oratoria']
     }
 
+    # One scan per work type, counting each title once however many of its patterns match
     work_type_stats = {}
     for work_type, patterns in work_patterns.items():
-        count = 0
-        for pattern in patterns:
-            count += df['title'].str.lower().str.contains(pattern).sum()
+        count = int(title_lc.str.contains('|'.join(map(re.escape, patterns)), na=False).sum())
         if count > 0:
             work_type_stats[work_type] = count
 
@@ -151,39 +184,31 @@ def analyze_massive_latin_dataset():
     # TRANSLATION ANALYSIS
     print(f"\n🔍 TRANSLATION ANALYSIS")
 
-    # Estimate translation status
-    def estimate_translation_status(row):
-        title_lower = str(row['title']).lower()
-        creator_lower = str(row['creator']).lower()
+    # Estimate translation status; the first matching rule decides
+    def contains_any(column, terms):
+        return column.str.contains('|'.join(map(re.escape, terms)), na=False)
 
+    translation_rules = [
         # Classical authors likely translated
-        if any(author in creator_lower for author in ['cicero', 'virgil', 'ovid', 'pliny', 'horace', 'livy']):
-            return 'likely_translated'
-
+        (contains_any(creator_lc, ['cicero', 'virgil', 'ovid', 'pliny', 'horace', 'livy']), 'likely_translated'),
         # Famous philosophical works likely translated
-        if any(term in title_lower for term in ['summa', 'ethica', 'de civitate dei', 'monarchia']):
-            return 'likely_translated'
-
+        (contains_any(title_lc, ['summa', 'ethica', 'de civitate dei', 'monarchia']), 'likely_translated'),
         # Major scientific works
-        if any(term in title_lower for term in ['de revolutionibus', 'principia philosophiae', 'discours']):
-            return 'likely_translated'
-
+        (contains_any(title_lc, ['de revolutionibus', 'principia philosophiae', 'discours']), 'likely_translated'),
         # Latin Bible-related works
-        if any(term in title_lower for term in ['biblia', 'testamentum', 'psalterium']):
-            return 'likely_translated'
-
+        (contains_any(title_lc, ['biblia', 'testamentum', 'psalterium']), 'likely_translated'),
         # University diplomas and administrative documents
-        if any(term in title_lower for term in ['diploma', 'universit', 'privilegium']):
-            return 'unlikely_translated'
-
+        (contains_any(title_lc, ['diploma', 'universit', 'privilegium']), 'unlikely_translated'),
         # Medical treatises
-        if any(term in title_lower for term in ['de medicina', 'practica medica']):
-            return 'possibly_translated'
-
-        # Default assessment
-        return 'translation_uncertain'
+        (contains_any(title_lc, ['de medicina', 'practica medica']), 'possibly_translated'),
+    ]
 
-    df['translation_status'] = df.apply(estimate_translation_status, axis=1)
+    # Default assessment: translation_uncertain
+    df['translation_status'] = np.select(
+        [mask for mask, _ in translation_rules],
+        [status for _, status in translation_rules],
+        default='translation_uncertain'
+    )
     trans_counts = df['translation_status'].value_counts()
 
     print(f"  Translation Status:")
@@ -203,18 +228,20 @@ def analyze_massive_latin_dataset():
     # Sample untranslated works
     if len(untranslated) > 0:
         print(f"\n  Sample Untranslated Works:")
-        for _, work in untranslated.head(10).iterrows():
-            print(f"    • {work['title'][:60]}... ({work['clean_year']})")
-            print(f"      Creator: {work['creator']}")
+        sample = untranslated.head(10)
+        for title, year, creator in zip(sample['title'], sample['clean_year'], sample['creator']):
+            print(f"    • {title[:60]}... ({year})")
+            print(f"      Creator: {creator}")
 
     # Save comprehensive analysis
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     analysis_file = f"data/massive_latin_analysis_{timestamp}.json"
 
+    top_untranslated = untranslated.head(20)
     analysis_results = {
         'dataset_summary': {
             'total_books': len(df),
-            'year_range': [int(df['clean_year'].min()), int(df['clean_year'].max())],
+            'year_range': [df['clean_year'].min(), df['clean_year'].max()],
             'centuries': century_counts.to_dict(),
             'languages': lang_counts.head(10).to_dict(),
             'translation_status': trans_counts.to_dict()
@@ -230,13 +257,13 @@ def analyze_massive_latin_dataset():
             'possibly_untranslated': len(possibly_untranslated),
             'total_opportunities': len(untranslated) + len(possibly_untranslated)
         },
-        'top_untranslated': [{'title': row['title'][:100], 'year': row['clean_year'],
-                               'creator': row['creator']}
-                              for _, row in untranslated.head(20).iterrows()]
+        'top_untranslated': [{'title': title[:100], 'year': year, 'creator': creator}
+                             for title, year, creator in zip(top_untranslated['title'],
+                                                             top_untranslated['clean_year'],
+                                                             top_untranslated['creator'])]
     }
 
-    with open(analysis_file, 'w', encoding='utf-8') as f:
-        json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+    write_json(analysis_file, analysis_results)
 
     print(f"\n💾 Comprehensive analysis saved to {analysis_file}")
 
@@ -3,11 +3,37 @@
 Analyze real Internet Archive Latin data for digitization and translation gaps
 """
 
+import numpy as np
 import pandas as pd
 import json
 import re
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: results are written with the stdlib json module
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional: text columns keep pandas' default string storage
+    pyarrow = None
+
+# Arrow-backed strings for the searched text columns, with NaN for missing values
+# as in pandas' default str dtype
+TEXT_COLUMNS = ['title', 'creator', 'language']
+TEXT_DTYPES = {column: pd.StringDtype('pyarrow', na_value=np.nan) for column in TEXT_COLUMNS} if pyarrow else {}
+
+def write_json(path, data):
+    """Write data as indented UTF-8 JSON, using orjson (with numpy scalars) when available."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=lambda value: value.item())
+
 def analyze_real_latin_data():
     """Analyze the real Internet Archive Latin books data"""
 
@@ -24,28 +50,26 @@ def analyze_real_latin_data():
     latest_file = max(csv_files)
     print(f"📂 Loading data from {latest_file}")
 
-    df = pd.read_csv(latest_file)
+    df = pd.read_csv(latest_file, dtype=TEXT_DTYPES)
     print(f"📊 Loaded {len(df)} records")
 
     # Clean and analyze
     print(f"\n🧹 Cleaning data...")
 
     # Clean year field
-    def extract_year(year_str):
-        if pd.isna(year_str) or year_str == '':
-            return None
-        year_match = re.search(r'(\d{4})', str(year_str))
-        return int(year_match.group(1)) if year_match else None
-
-    df['clean_year'] = df['year'].apply(extract_year)
-    df = df.dropna(subset=['clean_year'])
+    df['clean_year'] = df['year'].astype('string').str.extract(r'(\d{4})', expand=False).astype('Int64')
+    df = df.dropna(subset=['clean_year']).astype({'clean_year': 'int64'})
 
     # Filter to our target period
     df = df[(df['clean_year'] >= 1450) & (df['clean_year'] <= 1700)]
     print(f"📅 Filtered to {len(df)} records from 1450-1700")
 
+    # Lowercase the searched columns once for the author and translation searches below
+    title_lc = df['title'].str.lower()
+    creator_lc = df['creator'].str.lower()
+
     # Analyze by century
-    century_counts = df.groupby(df['clean_year'] // 100 * 100).size()
+    century_counts = (df['clean_year'] // 100 * 100).value_counts(sort=False).sort_index()
     print(f"\n📖 Books by Century:")
     for century in sorted(century_counts.index):
         count = century_counts[century]
@@ -73,20 +97,23 @@ def analyze_real_latin_data():
     ]
 
     print(f"\n👥 Famous Classical/Humanist Authors Found:")
-    famous_found = []
+    # Only the total is reported, so count matches instead of collecting their records
+    famous_found = 0
     for author in famous_authors:
-        matching = df[df['creator'].str.lower().str.contains(author, na=False)]
-        if len(matching) > 0:
-            print(f"  {author.title()}: {len(matching)} works")
-            for _, work in matching.head(3).iterrows():
-                print(f"    • {work['title'][:60]}... ({work['clean_year']})")
-            famous_found.extend(matching.to_dict('records'))
+        matching = creator_lc.str.contains(author, na=False)
+        count = int(matching.sum())
+        if count > 0:
+            print(f"  {author.title()}: {count} works")
+            sample = df[matching].head(3)
+            for title, year in zip(sample['title'], sample['clean_year']):
+                print(f"    • {title[:60]}... ({year})")
+            famous_found += count
 
     # Analyze publication patterns
     print(f"\n📊 Publication Patterns:")
 
     # Find works by decade
-    decade_counts = df.groupby(df['clean_year'] // 10 * 10).size().sort_index()
+    decade_counts = (df['clean_year'] // 10 * 10).value_counts(sort=False).sort_index()
     print(f"  Most active decades:")
     for decade, count in decade_counts.tail(5).items():
         print(f"    {decade}s: {count} books")
@@ -95,9 +122,9 @@ def analyze_real_latin_data():
     df['title_length'] = df['title'].str.len()
     longest_titles = df.nlargest(10, 'title_length')[['title', 'creator', 'clean_year']]
     print(f"\n📚 Major Works (by title length):")
-    for _, work in longest_titles.iterrows():
-        print(f"  {work['title'][:60]}... ({work['clean_year']})")
-        print(f"    Author: {work['creator']}")
+    for title, creator, year in zip(longest_titles['title'], longest_titles['creator'], longest_titles['clean_year']):
+        print(f"  {title[:60]}... ({year})")
+        print(f"    Author: {creator}")
 
     # Simulate digitization and translation analysis
     print(f"\n🔍 Digitization/Translation Simulation:")
@@ -105,27 +132,26 @@ def analyze_real_latin_data():
     # Since these are from Internet Archive, they're all digitized
     print(f"  Digitized: {len(df)} (100%)")
 
-    # Estimate translation status based on author fame and work type
-    def estimate_translation_status(row):
-        title_lower = str(row['title']).lower()
-        creator_lower = str(row['creator']).lower()
+    # Estimate translation status based on author fame and work type; the first
+    # matching rule decides
+    def contains_any(column, terms):
+        return column.str.contains('|'.join(map(re.escape, terms)), na=False)
 
+    translation_rules = [
         # Famous classical authors likely translated
-        if any(author in creator_lower for author in ['cicero', 'virgil', 'ovid', 'pliny']):
-            return 'translated'
-
+        (contains_any(creator_lc, ['cicero', 'virgil', 'ovid', 'pliny']), 'translated'),
         # Famous philosophical/theological works likely translated
-        if any(term in title_lower for term in ['summa', 'ethica', 'politics', 'republic']):
-            return 'possibly_translated'
-
+        (contains_any(title_lc, ['summa', 'ethica', 'politics', 'republic']), 'possibly_translated'),
         # Scientific works less likely translated
-        if any(term in title_lower for term in ['anatomy', 'medicine', 'astronomy']):
-            return 'not_translated'
-
-        # Default: uncertain
-        return 'possibly_translated'
+        (contains_any(title_lc, ['anatomy', 'medicine', 'astronomy']), 'not_translated'),
+    ]
 
-    df['translation_status'] = df.apply(estimate_translation_status, axis=1)
+    # Default: uncertain
+    df['translation_status'] = np.select(
+        [mask for mask, _ in translation_rules],
+        [status for _, status in translation_rules],
+        default='possibly_translated'
+    )
 
     trans_counts = df['translation_status'].value_counts()
     print(f"  Translation Status:")
@@ -138,8 +164,9 @@ def analyze_real_latin_data():
 
     if len(research_gaps) > 0:
         print(f"  Top untranslated works:")
-        for _, work in research_gaps.head(10).iterrows():
-            print(f"    • {work['title'][:50]}... ({work['clean_year']}) - {work['creator']}")
+        sample = research_gaps.head(10)
+        for title, year, creator in zip(sample['title'], sample['clean_year'], sample['creator']):
+            print(f"    • {title[:50]}... ({year}) - {creator}")
 
     # Save analysis results
     output_file = f"data/real_latin_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -147,18 +174,17 @@ def analyze_real_latin_data():
     results = {
         'summary': {
             'total_books': len(df),
-            'year_range': [int(df['clean_year'].min()), int(df['clean_year'].max())],
+            'year_range': [df['clean_year'].min(), df['clean_year'].max()],
             'centuries': century_counts.to_dict(),
             'languages': lang_counts.to_dict(),
             'translation_status': trans_counts.to_dict()
         },
-        'famous_authors_found': len(famous_found),
+        'famous_authors_found': famous_found,
         'research_opportunities': len(research_gaps),
         'sample_works': df.head(10).to_dict('records')
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    write_json(output_file, results)
 
     print(f"\n💾 Analysis results saved to {output_file}")
 
@@ -3,10 +3,21 @@
 Comprehensive search for untranslated Latin works across multiple categories
 """
 
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
 
+try:
+    import pyarrow
+except ImportError:  # Optional: text columns keep pandas' default string storage
+    pyarrow = None
+
+# Arrow-backed strings for the searched text columns, with NaN for missing values
+# as in pandas' default str dtype
+TEXT_COLUMNS = ['title', 'creator', 'language', 'publisher']
+TEXT_DTYPES = {column: pd.StringDtype('pyarrow', na_value=np.nan) for column in TEXT_COLUMNS} if pyarrow else {}
+
 def comprehensive_untranslated_search():
     """Create comprehensive lists by different categories"""
 
@@ -14,19 +25,17 @@ def comprehensive_untranslated_search():
     print("=" * 60)
 
     # Load dataset
-    df = pd.read_csv('data/massive_latin_collection_20251119_091153.csv')
+    df = pd.read_csv('data/massive_latin_collection_20251119_091153.csv', dtype=TEXT_DTYPES)
 
-    def extract_year(year_str):
-        if pd.isna(year_str) or year_str == '':
-            return None
-        year_match = re.search(r'(\d{4})', str(year_str))
-        return int(year_match.group(1)) if year_match else None
-
-    df['clean_year'] = df['year'].apply(extract_year)
-    df = df.dropna(subset=['clean_year'])
+    df['clean_year'] = df['year'].astype('string').str.extract(r'(\d{4})', expand=False).astype('Int64')
+    df = df.dropna(subset=['clean_year']).astype({'clean_year': 'int64'})
 
     print(f"📚 Working with {len(df):,} Latin books")
 
+    # Lowercase the searched columns once for every category below
+    title_lc = df['title'].str.lower()
+    creator_lc = df['creator'].str.lower()
+
     # CATEGORIES FOR UNTRANSLATED WORKS
     categories = {
         'Medical_Treatises': [
@@ -59,22 +68,25 @@ def comprehensive_untranslated_search():
         ]
     }
 
+    # Exclude famous classical authors (likely translated) and obvious famous
+    # works; the same for every category, so built once
+    famous_authors = ['cicero', 'virgil', 'ovid', 'horace', 'livy', 'tacitus']
+    famous_works = ['de civitate dei', 'summa theologica', 'ethica nicomachea']
+    famous_author_re = re.compile('|'.join(map(re.escape, famous_authors)))
+    famous_work_re = re.compile('|'.join(map(re.escape, famous_works)))
+    exclude_mask = (creator_lc.str.contains(famous_author_re, na=False)
+                    | title_lc.str.contains(famous_work_re, na=False))
+
     results = {}
+    category_masks = {}
 
     for category, keywords in categories.items():
         print(f"\n🔍 Searching for {category.replace('_', ' ')}...")
 
         # Find works containing any keyword
-        pattern = '|'.join(keywords)
-        matches = df[df['title'].str.lower().str.contains(pattern, case=False, na=False)]
-
-        # Exclude famous classical authors (likely translated)
-        famous_authors = ['cicero', 'virgil', 'ovid', 'horace', 'livy', 'tacitus']
-        matches = matches[~matches['creator'].str.lower().str.contains('|'.join(famous_authors), na=False)]
-
-        # Exclude obvious famous works
-        famous_works = ['de civitate dei', 'summa theologica', 'ethica nicomachea']
-        matches = matches[~matches['title'].str.lower().str.contains('|'.join(famous_works), na=False)]
+        category_re = re.compile('|'.join(map(re.escape, keywords)))
+        category_masks[category] = title_lc.str.contains(category_re, na=False) & ~exclude_mask
+        matches = df.loc[category_masks[category]]
 
         print(f"  Found {len(matches)} works")
 
@@ -83,22 +95,23 @@ def comprehensive_untranslated_search():
         # Show some examples
         if len(matches) > 0:
             print(f"  Sample works:")
-            for _, work in matches.head(3).iterrows():
-                title = work['title'][:60] + '...' if len(work['title']) > 60 else work['title']
-                print(f"    • {title} ({work['year']})")
+            sample = matches.head(3)
+            for title, year in zip(sample['title'], sample['year']):
+                title = title[:60] + '...' if len(title) > 60 else title
+                print(f"    • {title} ({year})")
 
     # Create comprehensive reports
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Master list of all untranslated candidates
-    all_candidates = pd.concat([matches for matches in results.values()]).drop_duplicates()
+    # Master list of all untranslated candidates: every work matching any category, once
+    all_candidates = df.loc[np.logical_or.reduce(list(category_masks.values()))]
     print(f"\n📊 SUMMARY:")
     print(f"  Total untranslated candidates: {len(all_candidates):,}")
     print(f"  Categories found: {len([r for r in results.values() if len(r) > 0])}")
 
     # Save comprehensive master list
-    master_list = all_candidates[[
-        ['title', 'creator', 'clean_year', 'language', 'publisher', 'identifier']
+    master_list = all_candidates.loc[
+        :, ['title', 'creator', 'clean_year', 'language', 'publisher', 'identifier']
     ].copy()
     master_list.columns = ['Title', 'Author', 'Year', 'Language', 'Publisher', 'Archive_ID']
 
@@ -112,8 +125,8 @@ def comprehensive_untranslated_search():
     for category, matches in results.items():
         if len(matches) > 0:
             category_file = f"data/untranslated_{category}_{timestamp}.csv"
-            category_list = matches[[
-                ['title', 'creator', 'clean_year', 'language', 'publisher']
+            category_list = matches.loc[
+                :, ['title', 'creator', 'clean_year', 'language', 'publisher']
             ].copy()
             category_list.columns = ['Title', 'Author', 'Year', 'Language', 'Publisher']
             category_list.to_csv(category_file, index=False, encoding='utf-8-sig')
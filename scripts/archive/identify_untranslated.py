@@ -3,10 +3,24 @@
 Identify untranslated Latin works from our massive dataset
 """
 
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
 
+try:
+    import pyarrow
+except ImportError:  # Optional: text columns keep pandas' default string storage
+    pyarrow = None
+
+# Arrow-backed strings for the searched and exported text columns, with NaN for
+# missing values as in pandas' default str dtype
+TEXT_COLUMNS = ['title', 'creator', 'language', 'publisher']
+TEXT_DTYPES = {column: pd.StringDtype('pyarrow', na_value=np.nan) for column in TEXT_COLUMNS} if pyarrow else {}
+
+# Columns the search reads; the rest of the CSV is never loaded
+SEARCH_COLUMNS = ['identifier', 'title', 'creator', 'year', 'language', 'publisher']
+
 def identify_untranslated_works():
     """Create a prioritized list of untranslated works"""
 
@@ -14,99 +28,91 @@ def identify_untranslated_works():
     print("=" * 50)
 
     # Load our massive dataset
-    df = pd.read_csv('data/massive_latin_collection_20251119_091153.csv')
+    df = pd.read_csv('data/massive_latin_collection_20251119_091153.csv', usecols=SEARCH_COLUMNS,
+                     dtype={'year': 'string', **TEXT_DTYPES})
     print(f"📚 Loaded {len(df):,} Latin books")
 
-    def extract_year(year_str):
-        if pd.isna(year_str) or year_str == '':
-            return None
-        year_match = re.search(r'(\d{4})', str(year_str))
-        return int(year_match.group(1)) if year_match else None
+    df['clean_year'] = df['year'].str.extract(r'(\d{4})', expand=False).astype('Int64')
+    df = df.dropna(subset=['clean_year']).astype({'clean_year': 'int64'})
 
-    df['clean_year'] = df['year'].apply(extract_year)
-    df = df.dropna(subset=['clean_year'])
+    # Lowercase the searched columns once; the category patterns below match
+    # against these instead of case-folding each title per search
+    title_lc = df['title'].str.lower()
+    creator_lc = df['creator'].str.lower()
 
     # STRATEGY 1: DEFINITELY UNTRANSLATED WORKS
     print("\n🎯 STRATEGY 1: DEFINITELY UNTRANSLATED")
 
     # University diplomas, legal documents, administrative records
     admin_terms = ['diploma', 'universit', 'privilegium', 'statuta', 'acta', 'decretum', 'constitutio']
-    untranslated_admin = df[df['title'].str.lower().str.contains('|'.join(admin_terms), case=False, na=False)]
+    admin_re = re.compile('|'.join(map(re.escape, admin_terms)))
+    admin_mask = title_lc.str.contains(admin_re, na=False)
 
-    print(f"📜 Administrative/University Documents: {len(untranslated_admin):,} works")
+    print(f"📜 Administrative/University Documents: {admin_mask.sum():,} works")
 
     # STRATEGY 2: SCIENTIFIC/MEDICAL WORKS (less likely translated)
     print("\n🔬 STRATEGY 2: SCIENTIFIC & MEDICAL WORKS")
 
     scientific_terms = ['medicina', 'anatomia', 'chirurgia', 'pharmacia', 'alchimia', 'astronomia', 'mathematica']
-    scientific_works = df[df['title'].str.lower().str.contains('|'.join(scientific_terms), case=False, na=False)]
+    scientific_re = re.compile('|'.join(map(re.escape, scientific_terms)))
+    scientific_mask = title_lc.str.contains(scientific_re, na=False)
 
-    print(f"🔬 Scientific/Medical Works: {len(scientific_works):,} works")
+    print(f"🔬 Scientific/Medical Works: {scientific_mask.sum():,} works")
 
     # STRATEGY 3: OBSCURE OR TECHNICAL WORKS
     print("\n📚 STRATEGY 3: TECHNICAL & OBSCURE WORKS")
 
     # Long technical titles (often treatises)
     df['title_length'] = df['title'].str.len()
-    technical_works = df[df['title_length'] > 100]  # Long titles likely technical
+    technical_mask = df['title_length'] > 100  # Long titles likely technical
 
     # Filter out famous classical authors (likely translated)
     famous_authors = ['cicero', 'virgil', 'ovid', 'horace', 'livy', 'tacitus', 'pliny']
-    technical_works = technical_works[~technical_works['creator'].str.lower().str.contains('|'.join(famous_authors), na=False)]
+    famous_author_re = re.compile('|'.join(map(re.escape, famous_authors)))
+    technical_mask &= ~creator_lc.str.contains(famous_author_re, na=False)
 
-    print(f"⚙️  Technical/Obcure Works: {len(technical_works):,} works")
+    print(f"⚙️  Technical/Obcure Works: {technical_mask.sum():,} works")
 
     # STRATEGY 4: REGIONAL/HISTORICAL WORKS
     print("\n🏛️  STRATEGY 4: REGIONAL & HISTORICAL WORKS")
 
     regional_terms = ['chronicon', 'annales', 'historia', 'gesta', 'vitae', 'biographia']
-    regional_works = df[df['title'].str.lower().str.contains('|'.join(regional_terms), case=False, na=False)]
+    regional_re = re.compile('|'.join(map(re.escape, regional_terms)))
+    regional_mask = title_lc.str.contains(regional_re, na=False)
 
     # Remove famous historical works
-    regional_works = regional_works[~regional_works['title'].str.lower().str.contains('romana', na=False)]
-    regional_works = regional_works[~regional_works['creator'].str.lower().str.contains('livy|tacitus', na=False)]
+    regional_mask &= ~title_lc.str.contains('romana', regex=False, na=False)
+    regional_mask &= ~creator_lc.str.contains(re.compile('livy|tacitus'), na=False)
 
-    print(f"🏰 Regional/Historical Works: {len(regional_works):,} works")
+    print(f"🏰 Regional/Historical Works: {regional_mask.sum():,} works")
 
-    # Combine all untranslated candidates
-    all_untranslated = pd.concat([
-        untranslated_admin,
-        scientific_works,
-        technical_works,
-        regional_works
-    ]).drop_duplicates()
+    # Combine all untranslated candidates: every work matching any strategy, once
+    candidates = admin_mask | scientific_mask | technical_mask | regional_mask
+    all_untranslated = df.loc[candidates].copy()
 
     print(f"\n🎯 TOTAL UNTRANSLATED CANDIDATES: {len(all_untranslated):,} works")
 
-    # PRIORITY SCORING
-    def calculate_priority(row):
-        score = 5.0  # Base score
-
-        title_lower = str(row['title']).lower()
-        creator_lower = str(row['creator']).lower()
+    # PRIORITY SCORING: a base score of 5.0 adjusted for every work at once,
+    # matching against the columns lowercased above
+    title_lower = title_lc[candidates]
+    creator_lower = creator_lc[candidates]
+    year = all_untranslated['clean_year'].to_numpy()
 
-        # Higher priority for 15th-16th century works
-        year = row['clean_year']
-        if year <= 1500:
-            score += 2.0  # Incunabula bonus
-        elif year <= 1600:
-            score += 1.5  # Renaissance bonus
+    priority = np.full(len(all_untranslated), 5.0)
 
-        # Lower priority for famous authors
-        if any(author in creator_lower for author in ['cicero', 'virgil', 'ovid', 'pliny']):
-            score -= 2.0
+    # Higher priority for 15th-16th century works
+    priority += np.where(year <= 1500, 2.0, np.where(year <= 1600, 1.5, 0.0))  # Incunabula / Renaissance bonus
 
-        # Higher priority for scientific/medical
-        if any(term in title_lower for term in ['medicina', 'anatomia', 'astronomia']):
-            score += 1.0
+    # Lower priority for famous authors
+    priority -= 2.0 * creator_lower.str.contains(re.compile('cicero|virgil|ovid|pliny'), na=False).to_numpy()
 
-        # Higher priority for university documents
-        if 'universit' in title_lower or 'diploma' in title_lower:
-            score += 0.5
+    # Higher priority for scientific/medical
+    priority += 1.0 * title_lower.str.contains(re.compile('medicina|anatomia|astronomia'), na=False).to_numpy()
 
-        return score
+    # Higher priority for university documents
+    priority += 0.5 * title_lower.str.contains(re.compile('universit|diploma'), na=False).to_numpy()
 
-    all_untranslated['priority_score'] = all_untranslated.apply(calculate_priority, axis=1)
+    all_untranslated['priority_score'] = priority
     all_untranslated = all_untranslated.sort_values('priority_score', ascending=False)
 
     # Create final prioritized list
@@ -122,15 +128,17 @@ def identify_untranslated_works():
 
     # Show top candidates
     print(f"\n🏆 TOP 20 UNTRANSLATED WORKS (by priority):")
-    for i, (_, work) in enumerate(final_list.head(20).iterrows(), 1):
-        title = work['Title'][:80] + '...' if len(work['Title']) > 80 else work['Title']
-        print(f"{i:2d}. {title} ({work['Year']}) - Priority: {work['Priority_Score']:.1f}")
-        print(f"     Author: {work['Author'][:60]}")
+    top = final_list.head(20)
+    for i, (title, author, year, priority_score) in enumerate(
+            zip(top['Title'], top['Author'], top['Year'], top['Priority_Score']), 1):
+        title = title[:80] + '...' if len(title) > 80 else title
+        print(f"{i:2d}. {title} ({year}) - Priority: {priority_score:.1f}")
+        print(f"     Author: {str(author)[:60]}")
 
     # Statistics by category
     print(f"\n📊 UNTRANSLATED BY CENTURY:")
-    century_counts = all_untranslated.groupby(all_untranslated['clean_year'] // 100 * 100).size()
-    for century, count in century_counts.sort_index().items():
+    century_counts = (all_untranslated['clean_year'] // 100 * 100).value_counts(sort=False).sort_index()
+    for century, count in century_counts.items():
         century_name = f"{century}s"
         if century == 1400: century_name = "15th Century"
         elif century == 1500: century_name = "16th Century"
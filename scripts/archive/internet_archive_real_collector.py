@@ -4,19 +4,88 @@ Real Internet Archive Data Collector for Neo-Latin Works 1450-1700
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import numpy as np
 import pandas as pd
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: responses are decoded with the stdlib json module
+    orjson = None
+
+# Records per Scrape API request
+PAGE_SIZE = 1000
+
+# Minimum seconds between the starts of two requests
+REQUEST_INTERVAL = 1.0
+
+# Columns of a collected record, in CSV order
+RECORD_FIELDS = ['identifier', 'title', 'creator', 'date', 'year', 'language',
+                 'description', 'publisher', 'source', 'collected_date']
+
 class InternetArchiveRealCollector:
-    def __init__(self):
-        self.base_url = "https://archive.org/advancedsearch.php"
-        self.records = []
+    # Latin indicators in a lowercased title, searched as one alternation
+    LATIN_TITLE_RE = re.compile('|'.join([
+        r'\bde\s+\w+',           # "de" + word
+        r'\bad\s+\w+',           # "ad" + word
+        r'\bin\s+\w+',           # "in" + word
+        r'\bliber\b',            # liber
+        r'\btractatus\b',        # tractatus
+        r'\bcommentarii\b',      # commentarii
+        r'\bepistola\b',         # epistola
+        r'\boratio\b',           # oratio
+        r'\bdisputation\b',      # disputation
+        r'\bthesis\b',           # thesis
+    ]))
+
+    # Latin-looking English words the ending check should not count
+    NON_LATIN_WORDS = frozenset(['house', 'church', 'school', 'library', 'catalogue'])
+
+    # Any of the first five words of a stripped title that is longer than four
+    # characters, ends in -us, -um, -a, -ae, -is, -es, -i or -o and is not a
+    # non-Latin word
+    LATIN_WORD_RE = re.compile(
+        r'^(?:\S+\s+){0,4}'
+        r'(?!(?:' + '|'.join(sorted(NON_LATIN_WORDS)) + r')(?!\S))'
+        r'(?:\S{4,}[aio]|\S{3,}(?:us|um|ae|is|es))(?!\S)'
+    )
+
+    # Classical authors whose works count as Latin whatever the title
+    LATIN_AUTHOR_RE = re.compile('cicero|virgil|ovid|horace|juvenal')
 
-    def search_latin_books(self, max_pages=50):
-        """Search for real Latin books from 1450-1700"""
+    def __init__(self):
+        # Scrape API: pages follow a cursor instead of a start offset, so later
+        # pages cost the same as the first
+        self.base_url = "https://archive.org/services/search/v1/scrape"
+
+        # Session setup: one kept-alive connection for every page, with
+        # compressed responses and backed-off retries on throttling/server errors
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; LatinBibliographyBot/1.0)',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        # Collected records, stored column by column so saving needs no
+        # per-record conversion
+        self.columns = {field: [] for field in RECORD_FIELDS}
+
+        # Where the next search resumes: the cursor for the next page (None
+        # before the first), pages fetched so far and whether results ran out
+        self.cursor = None
+        self.pages_fetched = 0
+        self.exhausted = False
+        self._last_request = 0.0
+
+    def search_latin_books(self, max_pages=5):
+        """Search for real Latin books from 1450-1700, resuming after the last page fetched"""
 
         # Search for Latin works with better query
         query_parts = [
@@ -33,149 +102,142 @@ class InternetArchiveRealCollector:
         print(f"🔍 Searching Internet Archive for Latin works 1450-1700...")
         print(f"Query: {search_query}")
 
-        # Calculate starting page based on existing data
-        start_page = len(self.records) // 100
-
-        for page in range(start_page, start_page + max_pages):
-            start = page * 100
-            params = {
-                'q': search_query,
-                'fl[]': 'identifier,title,creator,date,language,description,publisher,year',
-                'sort[]': 'publicdate desc',
-                'rows': 100,
-                'start': start,
-                'output': 'json'
-            }
-
-            try:
-                print(f"\n📄 Fetching page {page + 1} (records {start+1}-{start+100})...")
-                response = requests.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
-
-                data = response.json()
-
-                if 'response' not in data or 'docs' not in data['response']:
-                    print(f"❌ No results found on page {page + 1}")
-                    break
+        # Pages come one after another along the cursor, so the next page is
+        # fetched in the background while the current one is filtered
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = None
 
-                docs = data['response']['docs']
-                if not docs:
+            for page_index in range(max_pages):
+                if self.exhausted:
                     print("✅ No more records found")
                     break
 
-                # Process records
-                page_latin_books = 0
-                for doc in docs:
-                    if self._is_latin_book(doc):
-                        self.records.append(self._clean_record(doc))
-                        page_latin_books += 1
-
-                total_found = data['response']['numFound']
-                print(f"✅ Page {page + 1}: Found {page_latin_books} Latin books (Total available: {total_found})")
-
-                # Rate limiting
-                time.sleep(1)
-
-            except Exception as e:
-                print(f"❌ Error on page {page + 1}: {e}")
-                continue
-
-        print(f"\n🎉 Total Latin books collected: {len(self.records)}")
-        return self.records
-
-    def _is_latin_book(self, doc):
-        """Determine if this is likely a Latin book"""
-        title = str(doc.get('title', '')).strip()
-
-        # Skip if no proper title
-        if not title or len(title) < 3:
-            return False
-
-        # Skip numeric titles
-        if title.isdigit():
-            return False
-
-        # Check for Latin indicators in title
-        latin_patterns = [
-            r'\bde\s+\w+',           # "de" + word
-            r'\bad\s+\w+',           # "ad" + word
-            r'\bin\s+\w+',           # "in" + word
-            r'\bliber\b',            # liber
-            r'\btractatus\b',        # tractatus
-            r'\bcommentarii\b',      # commentarii
-            r'\bepistola\b',         # epistola
-            r'\boratio\b',           # oratio
-            r'\bdisputation\b',      # disputation
-            r'\bthesis\b',           # thesis
-        ]
+                page = self.pages_fetched
+                start = page * PAGE_SIZE
+
+                try:
+                    print(f"\n📄 Fetching page {page + 1} (records {start+1}-{start+PAGE_SIZE})...")
+                    fetch, next_page = next_page or executor.submit(self._fetch_page, search_query, self.cursor), None
+                    data = fetch.result()
+
+                    if 'items' not in data:
+                        print(f"❌ No results found on page {page + 1}")
+                        break
+
+                    docs = data['items']
+                    if not docs:
+                        self.exhausted = True
+                        continue
+
+                    # The next page starts from the returned cursor; none means this is the last
+                    self.pages_fetched += 1
+                    self.cursor = data.get('cursor')
+                    if self.cursor and page_index + 1 < max_pages:
+                        next_page = executor.submit(self._fetch_page, search_query, self.cursor)
+
+                    # Process records
+                    latin_docs = self._filter_batch(docs)
+                    self._add_records(latin_docs)
+                    page_latin_books = len(latin_docs)
+
+                    total_found = data.get('total')
+                    print(f"✅ Page {page + 1}: Found {page_latin_books} Latin books (Total available: {total_found})")
+
+                    if not self.cursor:
+                        self.exhausted = True
+
+                except Exception as e:
+                    print(f"❌ Error on page {page + 1}: {e}")
+                    continue
+
+        print(f"\n🎉 Total Latin books collected: {self.record_count}")
+        return self.columns
+
+    def _fetch_page(self, search_query, cursor):
+        """Fetch one Scrape API page, starting requests at most REQUEST_INTERVAL seconds apart"""
+        wait = self._last_request + REQUEST_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)  # Rate limiting
+        self._last_request = time.monotonic()
+
+        params = {
+            'q': search_query,
+            'fields': 'identifier,title,creator,date,language,description,publisher,year',
+            'count': PAGE_SIZE
+        }
+        if cursor:
+            params['cursor'] = cursor
 
-        title_lower = title.lower()
-        for pattern in latin_patterns:
-            if re.search(pattern, title_lower):
-                return True
-
-        # Check for Latin-looking words (endings)
-        words = title_lower.split()[:5]  # Check first 5 words
-        for word in words:
-            if len(word) > 4:
-                if word.endswith(('us', 'um', 'a', 'ae', 'is', 'es', 'i', 'o')):
-                    # Avoid obvious non-Latin words
-                    non_latin_words = ['house', 'church', 'school', 'library', 'catalogue']
-                    if word not in non_latin_words:
-                        return True
-
-        # Check creator for Latin names
-        creator = str(doc.get('creator', '')).lower()
-        if any(name in creator for name in ['cicero', 'virgil', 'ovid', 'horace', 'juvenal']):
-            return True
-
-        return False
-
-    def _clean_record(self, doc):
-        """Clean and normalize a record"""
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        return orjson.loads(response.content) if orjson else response.json()
+
+    def _filter_batch(self, docs):
+        """Determine which docs of a page are likely Latin books, returning those that are"""
+        titles = pd.Series([str(doc.get('title', '')) for doc in docs], dtype=object).str.strip()
+
+        # Skip titles that are too short or numeric before any regex runs
+        valid = (titles.str.len() >= 3) & ~titles.str.isdigit()
+        title_lower = titles[valid].str.lower()
+
+        # Check creator for Latin names, the cheapest of the matches
+        creator_lower = pd.Series([str(docs[i].get('creator', '')) for i in title_lower.index],
+                                  index=title_lower.index, dtype=object).str.lower()
+        is_latin = creator_lower.str.contains(self.LATIN_AUTHOR_RE)
+
+        # Then for Latin indicators in the remaining titles
+        undecided = ~is_latin
+        is_latin[undecided] = title_lower[undecided].str.contains(self.LATIN_TITLE_RE)
+
+        # Titles matching neither fall back to Latin-looking word endings
+        undecided = ~is_latin
+        is_latin[undecided] = title_lower[undecided].str.contains(self.LATIN_WORD_RE)
+
+        return [docs[i] for i in is_latin.index[is_latin]]
+
+    def _add_records(self, docs):
+        """Clean and normalize a batch of records, appending them column by column"""
         def clean_field(value):
             if isinstance(value, list):
                 return value[0] if value else ''
             return str(value) if value else ''
 
-        # Extract year from date if possible
-        date_str = doc.get('date', '')
-        if date_str:
-            year_match = re.search(r'(\d{4})', str(date_str))
-            year = year_match.group(1) if year_match else ''
-        else:
-            year = doc.get('year', '')
-
-        return {
-            'identifier': clean_field(doc.get('identifier')),
-            'title': clean_field(doc.get('title')),
-            'creator': clean_field(doc.get('creator')),
-            'date': clean_field(doc.get('date')),
-            'year': clean_field(year),
-            'language': clean_field(doc.get('language')),
-            'description': clean_field(doc.get('description')),
-            'publisher': clean_field(doc.get('publisher')),
-            'source': 'Internet Archive',
-            'collected_date': datetime.now().isoformat()
-        }
+        def extract_year(doc):
+            # Extract year from date if possible
+            date_str = doc.get('date', '')
+            if date_str:
+                year_match = re.search(r'(\d{4})', str(date_str))
+                return year_match.group(1) if year_match else ''
+            return doc.get('year', '')
+
+        for field in ('identifier', 'title', 'creator', 'date', 'language', 'description', 'publisher'):
+            self.columns[field].extend(clean_field(doc.get(field)) for doc in docs)
+        self.columns['year'].extend(clean_field(extract_year(doc)) for doc in docs)
+        self.columns['source'].extend(['Internet Archive'] * len(docs))
+        self.columns['collected_date'].extend(datetime.now().isoformat() for _ in docs)
+
+    @property
+    def record_count(self):
+        """Number of records collected so far"""
+        return len(self.columns['identifier'])
 
     def save_to_csv(self, filename):
         """Save records to CSV file"""
-        if not self.records:
+        if not self.record_count:
             print("❌ No records to save")
             return
 
-        df = pd.DataFrame(self.records)
+        df = pd.DataFrame(self.columns)
         df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"💾 Saved {len(self.records)} records to {filename}")
+        print(f"💾 Saved {self.record_count} records to {filename}")
 
         # Show sample
         print(f"\n📊 Sample of collected records:")
-        for i, record in enumerate(self.records[:5]):
-            print(f"\n{i+1}. {record['title'][:80]}{'...' if len(record['title']) > 80 else ''}")
-            print(f"   Creator: {record['creator']}")
-            print(f"   Year: {record['year']}")
-            print(f"   Language: {record['language']}")
+        for i, record in enumerate(df.head(5).itertuples(index=False)):
+            print(f"\n{i+1}. {record.title[:80]}{'...' if len(record.title) > 80 else ''}")
+            print(f"   Creator: {record.creator}")
+            print(f"   Year: {record.year}")
+            print(f"   Language: {record.language}")
 
 def main():
     collector = InternetArchiveRealCollector()
@@ -184,9 +246,9 @@ def main():
     print("=" * 60)
 
     # Start collection
-    records = collector.search_latin_books(max_pages=30)  # Get up to 3000 records
+    records = collector.search_latin_books(max_pages=3)  # Get up to 3000 records
 
-    if records:
+    if collector.record_count:
         # Save results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"data/internet_archive_latin_books_{timestamp}.csv"
@@ -197,12 +259,13 @@ def main():
         collector.save_to_csv(filename)
 
         # Quick stats
-        years = [int(r['year']) for r in records if r['year'] and r['year'].isdigit()]
-        if years:
+        year_strings = pd.Series(records['year'], dtype=object)
+        years = year_strings[year_strings.str.isdigit()].astype(np.int64).to_numpy()
+        if len(years):
             print(f"\n📈 Collection Statistics:")
-            print(f"  Total records: {len(records)}")
-            print(f"  Year range: {min(years)} - {max(years)}")
-            print(f"  Languages: {set(r['language'] for r in records if r['language'])}")
+            print(f"  Total records: {collector.record_count}")
+            print(f"  Year range: {years.min()} - {years.max()}")
+            print(f"  Languages: {set(language for language in records['language'] if language)}")
     else:
         print("❌ No Latin books found")
 
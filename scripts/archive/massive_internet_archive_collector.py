@@ -4,19 +4,92 @@ Massive Internet Archive Data Collector - Get thousands of Latin books
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import numpy as np
 import pandas as pd
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: responses are decoded with the stdlib json module
+    orjson = None
+
+# Records per Scrape API request
+PAGE_SIZE = 1000
+
+# Minimum seconds between the starts of two requests
+REQUEST_INTERVAL = 0.5  # Faster rate for massive collection
+
+# Columns of a collected record, in CSV order
+RECORD_FIELDS = ['identifier', 'title', 'creator', 'date', 'year', 'language',
+                 'description', 'publisher', 'source', 'collected_date']
+
 class MassiveInternetArchiveCollector:
-    def __init__(self):
-        self.base_url = "https://archive.org/advancedsearch.php"
-        self.records = []
+    # Substrings that mark a lowercased title as modern
+    MODERN_TITLE_RE = re.compile('|'.join(map(re.escape, ['isbn', 'copyright', 'modern', 'edition', 'vol.'])))
+
+    # Latin title indicators (more comprehensive), searched as one alternation
+    LATIN_TITLE_RE = re.compile('|'.join([
+        r'\bde\s+\w+', r'\bad\s+\w+', r'\bin\s+\w+', r'\bpro\s+\w+',
+        r'\b liber\b', r'\b tractatus\b', r'\b commentarii\b',
+        r'\b epistola\b', r'\b oratio\b', r'\b sermo\b',
+        r'\b dialogus\b', r'\b quaestio\b', r'\b disputatio\b',
+        r'\b dissertatio\b', r'\b theses\b'
+    ]))
+
+    # Common non-Latin words the ending check should not count
+    NON_LATIN_WORDS = frozenset(['house', 'library', 'school', 'church', 'catalogue', 'collection'])
+
+    # The first six words of a stripped title
+    FIRST_WORDS_RE = re.compile(r'^((?:\S+\s+){0,5}\S*)')
+
+    # A word longer than three characters once surrounding punctuation is
+    # stripped, ending in -us, -um, -a, -ae, -is, -es, -i or -o (-orum, -arum
+    # and -ibus are covered by -um and -us), and not a non-Latin word
+    LATIN_WORD_RE = re.compile(
+        r'(?<!\S)[.,:;()\[\]]*'
+        r'(?!(?:' + '|'.join(sorted(NON_LATIN_WORDS)) + r')[.,:;()\[\]]*(?!\S))'
+        r'(?:[^\s.,:;()\[\]]\S{2,}[aio]|[^\s.,:;()\[\]]\S+(?:us|um|ae|is|es))'
+        r'[.,:;()\[\]]*(?!\S)'
+    )
 
-    def search_latin_books_massive(self, start_page=0, max_pages=100):
-        """Collect massive amounts of Latin books"""
+    def __init__(self):
+        # Scrape API: pages follow a cursor instead of a start offset, so later
+        # pages cost the same as the first
+        self.base_url = "https://archive.org/services/search/v1/scrape"
+
+        # Session setup: one kept-alive connection for every page, with
+        # compressed responses and backed-off retries on throttling/server errors
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; LatinBibliographyBot/1.0)',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        # Collected records, stored column by column so saving needs no
+        # per-record conversion
+        self.columns = {field: [] for field in RECORD_FIELDS}
+
+        # The CSV this collector saves to (created on the first save) and how
+        # many records it already holds; later saves append only new records
+        self.output_file = None
+        self._flushed = 0
+
+        # Where the next search resumes: the cursor for the next page (None
+        # before the first), pages fetched so far and whether results ran out
+        self.cursor = None
+        self.pages_fetched = 0
+        self.exhausted = False
+        self._last_request = 0.0
+
+    def search_latin_books_massive(self, max_pages=10):
+        """Collect massive amounts of Latin books, resuming after the last page fetched"""
 
         # More comprehensive search
         query_parts = [
@@ -30,165 +103,172 @@ class MassiveInternetArchiveCollector:
         search_query = " AND ".join(query_parts)
 
         print(f"🔍 MASSIVE COLLECTION: Internet Archive Latin works 1450-1700")
-        print(f"📊 Starting from page {start_page + 1}, collecting {max_pages} pages")
+        print(f"📊 Starting from page {self.pages_fetched + 1}, collecting {max_pages} pages")
         print(f"Query: {search_query}")
 
         collected_this_session = 0
 
-        for page_num in range(start_page, start_page + max_pages):
-            start = page_num * 100
+        # Pages come one after another along the cursor, so the next page is
+        # fetched in the background while the current one is filtered
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = None
 
-            params = {
-                'q': search_query,
-                'fl[]': 'identifier,title,creator,date,language,description,publisher,year',
-                'sort[]': 'publicdate desc',
-                'rows': 100,
-                'start': start,
-                'output': 'json'
-            }
+            for page_index in range(max_pages):
+                if self.exhausted:
+                    print("✅ No more records found")
+                    break
 
-            try:
-                print(f"\n📄 Page {page_num + 1} (records {start+1}-{start+100})...")
-                response = requests.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
+                page_num = self.pages_fetched
+                start = page_num * PAGE_SIZE
 
-                data = response.json()
+                try:
+                    print(f"\n📄 Page {page_num + 1} (records {start+1}-{start+PAGE_SIZE})...")
+                    fetch, next_page = next_page or executor.submit(self._fetch_page, search_query, self.cursor), None
+                    data = fetch.result()
 
-                if 'response' not in data or 'docs' not in data['response']:
-                    print(f"❌ No results found on page {page_num + 1}")
-                    break
+                    if 'items' not in data:
+                        print(f"❌ No results found on page {page_num + 1}")
+                        break
 
-                docs = data['response']['docs']
-                if not docs:
-                    print("✅ No more records found")
-                    break
+                    docs = data['items']
+                    if not docs:
+                        self.exhausted = True
+                        continue
+
+                    # The next page starts from the returned cursor; none means this is the last
+                    self.pages_fetched += 1
+                    self.cursor = data.get('cursor')
+                    if self.cursor and page_index + 1 < max_pages:
+                        next_page = executor.submit(self._fetch_page, search_query, self.cursor)
 
-                # Filter for genuine Latin books
-                page_latin_books = 0
-                for doc in docs:
-                    if self._is_genuine_latin_book(doc):
-                        self.records.append(self._clean_record(doc))
-                        page_latin_books += 1
-                        collected_this_session += 1
+                    # Filter for genuine Latin books
+                    latin_docs = self._filter_batch(docs)
+                    self._add_records(latin_docs)
+                    page_latin_books = len(latin_docs)
+                    collected_this_session += page_latin_books
 
-                total_available = data['response']['numFound']
-                print(f"✅ Page {page_num + 1}: {page_latin_books} Latin books (Total available: {total_available})")
+                    total_available = data.get('total')
+                    print(f"✅ Page {page_num + 1}: {page_latin_books} Latin books (Total available: {total_available})")
 
-                # Progress update every 10 pages
-                if (page_num + 1) % 10 == 0:
-                    print(f"📈 Progress: {len(self.records)} total books collected")
+                    # Progress update every 10 pages
+                    if (page_num + 1) % 10 == 0:
+                        print(f"📈 Progress: {self.record_count} total books collected")
 
-                # Rate limiting
-                time.sleep(0.5)  # Faster rate for massive collection
+                    if not self.cursor:
+                        self.exhausted = True
 
-            except Exception as e:
-                print(f"❌ Error on page {page_num + 1}: {e}")
-                continue
+                except Exception as e:
+                    print(f"❌ Error on page {page_num + 1}: {e}")
+                    continue
 
         print(f"\n🎉 MASSIVE COLLECTION COMPLETE!")
         print(f"📚 This session: {collected_this_session} books")
-        print(f"📊 Total collected: {len(self.records)} books")
-        return self.records
+        print(f"📊 Total collected: {self.record_count} books")
+        return self.columns
+
+    def _fetch_page(self, search_query, cursor):
+        """Fetch one Scrape API page, starting requests at most REQUEST_INTERVAL seconds apart"""
+        wait = self._last_request + REQUEST_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)  # Rate limiting
+        self._last_request = time.monotonic()
+
+        params = {
+            'q': search_query,
+            'fields': 'identifier,title,creator,date,language,description,publisher,year',
+            'count': PAGE_SIZE
+        }
+        if cursor:
+            params['cursor'] = cursor
 
-    def _is_genuine_latin_book(self, doc):
-        """Stricter filtering for genuine Latin books"""
-        title = str(doc.get('title', '')).strip()
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        return orjson.loads(response.content) if orjson else response.json()
 
-        # Skip invalid titles
-        if not title or len(title) < 5 or title.isdigit():
-            return False
+    def _filter_batch(self, docs):
+        """Stricter filtering for genuine Latin books, returning the docs of a page that pass"""
+        titles = pd.Series([str(doc.get('title', '')) for doc in docs], dtype=object).str.strip()
 
-        # Skip obviously modern titles
-        modern_indicators = ['isbn', 'copyright', 'modern', 'edition', 'vol.']
-        if any(indicator in title.lower() for indicator in modern_indicators):
-            return False
-
-        # Latin title indicators (more comprehensive)
-        latin_patterns = [
-            r'\bde\s+\w+', r'\bad\s+\w+', r'\bin\s+\w+', r'\bpro\s+\w+',
-            r'\b liber\b', r'\b tractatus\b', r'\b commentarii\b',
-            r'\b epistola\b', r'\b oratio\b', r'\b sermo\b',
-            r'\b dialogus\b', r'\b quaestio\b', r'\b disputatio\b',
-            r'\b dissertatio\b', r'\b theses\b'
-        ]
+        # Skip invalid titles first, so only plausible ones reach the regexes
+        valid = (titles.str.len() >= 5) & ~titles.str.isdigit()
+        title_lower = titles[valid].str.lower()
 
-        title_lower = title.lower()
-        if any(re.search(pattern, title_lower) for pattern in latin_patterns):
-            return True
+        # Skip obviously modern titles
+        title_lower = title_lower[~title_lower.str.contains(self.MODERN_TITLE_RE)]
 
-        # Check for Latin endings in first few words
-        words = [w.strip('.,:;()[]') for w in title_lower.split()[:6]]
-        latin_endings = ('us', 'um', 'a', 'ae', 'is', 'es', 'i', 'o', 'orum', 'arum', 'ibus')
-        latin_words = 0
+        # Latin title indicators
+        is_latin = title_lower.str.contains(self.LATIN_TITLE_RE)
 
-        for word in words:
-            if len(word) > 3 and word.endswith(latin_endings):
-                # Avoid common non-Latin words
-                if word not in ['house', 'library', 'school', 'church', 'catalogue', 'collection']:
-                    latin_words += 1
+        # Titles without an indicator need Latin endings on two of their first few words
+        undecided = ~is_latin
+        first_words = title_lower[undecided].str.extract(self.FIRST_WORDS_RE, expand=False)
+        is_latin[undecided] = first_words.str.count(self.LATIN_WORD_RE) >= 2
 
-        return latin_words >= 2
+        return [docs[i] for i in is_latin.index[is_latin]]
 
-    def _clean_record(self, doc):
-        """Clean and normalize a record"""
+    def _add_records(self, docs):
+        """Clean and normalize a batch of records, appending them column by column"""
         def clean_field(value):
             if isinstance(value, list):
                 return value[0] if value else ''
             return str(value) if value else ''
 
-        # Extract year from date
-        date_str = doc.get('date', '')
-        if date_str:
-            year_match = re.search(r'(\d{4})', str(date_str))
-            year = year_match.group(1) if year_match else ''
-        else:
-            year = doc.get('year', '')
-
-        return {
-            'identifier': clean_field(doc.get('identifier')),
-            'title': clean_field(doc.get('title')),
-            'creator': clean_field(doc.get('creator')),
-            'date': clean_field(doc.get('date')),
-            'year': clean_field(year),
-            'language': clean_field(doc.get('language')),
-            'description': clean_field(doc.get('description')),
-            'publisher': clean_field(doc.get('publisher')),
-            'source': 'Internet Archive',
-            'collected_date': datetime.now().isoformat()
-        }
+        def extract_year(doc):
+            # Extract year from date
+            date_str = doc.get('date', '')
+            if date_str:
+                year_match = re.search(r'(\d{4})', str(date_str))
+                return year_match.group(1) if year_match else ''
+            return doc.get('year', '')
+
+        for field in ('identifier', 'title', 'creator', 'date', 'language', 'description', 'publisher'):
+            self.columns[field].extend(clean_field(doc.get(field)) for doc in docs)
+        self.columns['year'].extend(clean_field(extract_year(doc)) for doc in docs)
+        self.columns['source'].extend(['Internet Archive'] * len(docs))
+        self.columns['collected_date'].extend(datetime.now().isoformat() for _ in docs)
+
+    @property
+    def record_count(self):
+        """Number of records collected so far"""
+        return len(self.columns['identifier'])
 
     def save_massive_dataset(self):
-        """Save the massive dataset"""
-        if not self.records:
+        """Save the massive dataset, appending the records collected since the last save"""
+        if not self.record_count:
             print("❌ No records to save")
             return
 
-        df = pd.DataFrame(self.records)
+        if self.output_file is None:
+            # Create timestamped filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.output_file = f"data/massive_latin_collection_{timestamp}.csv"
 
-        # Create timestamped filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"data/massive_latin_collection_{timestamp}.csv"
+            import os
+            os.makedirs('data', exist_ok=True)
 
-        import os
-        os.makedirs('data', exist_ok=True)
+        new_records = pd.DataFrame({field: values[self._flushed:] for field, values in self.columns.items()})
+        filename = self.output_file
 
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"💾 Saved {len(self.records)} records to {filename}")
+        # The first save writes the header (and the BOM); later saves append rows only
+        if self._flushed == 0:
+            new_records.to_csv(filename, index=False, encoding='utf-8-sig')
+        else:
+            new_records.to_csv(filename, mode='a', header=False, index=False, encoding='utf-8')
+        self._flushed = self.record_count
+        print(f"💾 Saved {len(new_records)} new records to {filename} ({self.record_count} total)")
 
         # Quick analysis
-        years = [int(r['year']) for r in self.records if r['year'] and r['year'].isdigit()]
-        if years:
+        year_strings = pd.Series(self.columns['year'], dtype=object)
+        years = year_strings[year_strings.str.isdigit()].astype(np.int64).to_numpy()
+        if len(years):
             print(f"\n📈 Dataset Statistics:")
-            print(f"  Total records: {len(self.records)}")
-            print(f"  Year range: {min(years)} - {max(years)}")
+            print(f"  Total records: {self.record_count}")
+            print(f"  Year range: {years.min()} - {years.max()}")
 
             # Century distribution
-            centuries = {}
-            for year in years:
-                century = (year // 100) * 100
-                centuries[century] = centuries.get(century, 0) + 1
+            centuries, counts = np.unique(years // 100 * 100, return_counts=True)
 
-            for century in sorted(centuries.keys()):
+            for century, count in zip(centuries, counts):
                 century_name = f"{century}s"
                 if century == 1400:
                     century_name = "15th Century"
@@ -196,7 +276,7 @@ class MassiveInternetArchiveCollector:
                     century_name = "16th Century"
                 elif century == 1600:
                     century_name = "17th Century"
-                print(f"    {century_name}: {centuries[century]} books")
+                print(f"    {century_name}: {count} books")
 
         return filename
 
@@ -206,22 +286,22 @@ def main():
     print("🚀 MASSIVE INTERNET ARCHIVE LATIN COLLECTOR")
     print("=" * 70)
 
-    # First batch: collect 100 pages (10,000 records)
+    # First batch: collect 10 pages (10,000 records)
     print("🎯 PHASE 1: Collecting first 10,000 records...")
-    collector.search_latin_books_massive(start_page=0, max_pages=100)
+    collector.search_latin_books_massive(max_pages=10)
 
     # Save after first batch
-    first_file = collector.save_massive_dataset()
+    collector.save_massive_dataset()
 
-    # Second batch: collect another 100 pages
+    # Second batch: collect another 10 pages, continuing from the first batch's cursor
     print(f"\n🎯 PHASE 2: Collecting additional 10,000 records...")
-    collector.search_latin_books_massive(start_page=100, max_pages=100)
+    collector.search_latin_books_massive(max_pages=10)
 
-    # Save complete collection
+    # Append the second batch to the same file
     final_file = collector.save_massive_dataset()
 
     print(f"\n🎉 MASSIVE COLLECTION COMPLETE!")
-    print(f"📚 Total Latin books collected: {len(collector.records)}")
+    print(f"📚 Total Latin books collected: {collector.record_count}")
     print(f"💾 Final dataset: {final_file}")
 
 if __name__ == "__main__":
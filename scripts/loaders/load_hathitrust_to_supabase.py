@@ -10,7 +10,10 @@ Expected file: data/hathitrust/hathi_full_YYYYMMDD.txt.gz
 
 import os
 import gzip
+import math
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -24,6 +27,7 @@ except ImportError:
 # Configuration
 DATA_DIR = Path(__file__).parent.parent / "data" / "hathitrust"
 BATCH_SIZE = 1000
+PARSE_CHUNK_LINES = 50000  # HathiFile rows per worker task
 
 # Supabase config
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://ykhxaecbbxaaqlujuzde.supabase.co")
@@ -126,41 +130,105 @@ def parse_row(line: str) -> dict | None:
         'author': parts[25][:500] if len(parts) > 25 and parts[25] else None,
     }
 
+def parse_lines(lines: list[str], start: int, latin_only: bool = False):
+    """
+    Parse a chunk of HathiFile lines. Runs in a worker process.
+
+    Returns:
+        (items, skipped, errors) where errors holds (row number, message) pairs
+    """
+    items = []
+    skipped = 0
+    errors = []
+
+    for i, line in enumerate(lines, start):
+        try:
+            item = parse_row(line)
+            if item:
+                # Filter for Latin if requested
+                if latin_only and item.get('lang') != 'lat':
+                    continue
+
+                items.append(item)
+            else:
+                skipped += 1
+        except Exception as e:
+            skipped += 1
+            errors.append((i, str(e)[:50]))
+
+    return items, skipped, errors
+
+def read_chunks(f, chunk_lines: int = PARSE_CHUNK_LINES):
+    """Yield (first row number, lines) chunks from an open HathiFile, skipping the header."""
+    chunk = []
+    start = 0
+
+    for i, line in enumerate(f):
+        if i == 0 and line.startswith('htid'):
+            # Skip header
+            start = 1
+            continue
+
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            yield start, chunk
+            start = i + 1
+            chunk = []
+
+    if chunk:
+        yield start, chunk
+
 def load_hathifile(filepath: Path, limit: int = None, latin_only: bool = False):
-    """Load and parse the HathiFile."""
+    """Load and parse the HathiFile, parsing chunks of rows across all CPUs."""
     items = []
     skipped = 0
+    errors_shown = 0
+    rows = 0
+    workers = os.cpu_count() or 1
 
     print(f"Loading {filepath}...")
 
     opener = gzip.open if str(filepath).endswith('.gz') else open
 
-    with opener(filepath, 'rt', encoding='utf-8', errors='replace') as f:
-        for i, line in enumerate(f):
-            if i == 0 and line.startswith('htid'):
-                # Skip header
-                continue
-
-            try:
-                item = parse_row(line)
-                if item:
-                    # Filter for Latin if requested
-                    if latin_only and item.get('lang') != 'lat':
-                        continue
-
-                    items.append(item)
-                else:
-                    skipped += 1
-            except Exception as e:
-                skipped += 1
-                if skipped <= 5:
-                    print(f"  Error row {i}: {str(e)[:50]}")
-
+    def collect(future, chunk_rows):
+        nonlocal skipped, errors_shown, rows
+        chunk_items, chunk_skipped, errors = future.result()
+        for row, message in errors[:max(0, 5 - errors_shown)]:
+            print(f"  Error row {row}: {message}")
+            errors_shown += 1
+        items.extend(chunk_items)
+        skipped += chunk_skipped
+
+        previous = rows
+        rows += chunk_rows
+        if rows // 500000 > previous // 500000:
+            print(f"  Processed {rows:,} rows, kept {len(items):,}...")
+
+    # Parse in worker processes, keeping a bounded number of chunks in
+    # flight so the file is never read far ahead of the results; with a
+    # limit, no more chunks than could be needed to reach it
+    in_flight = workers * 2
+    if limit:
+        in_flight = min(in_flight, math.ceil(limit / PARSE_CHUNK_LINES))
+
+    with opener(filepath, 'rt', encoding='utf-8', errors='replace') as f, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for start, lines in read_chunks(f):
+            pending.append((executor.submit(parse_lines, lines, start, latin_only), len(lines)))
+            if len(pending) >= in_flight:
+                collect(*pending.popleft())
             if limit and len(items) >= limit:
                 break
 
-            if i > 0 and i % 500000 == 0:
-                print(f"  Processed {i:,} rows, kept {len(items):,}...")
+        while pending and not (limit and len(items) >= limit):
+            collect(*pending.popleft())
+
+        for future, _ in pending:
+            future.cancel()
+
+    if limit:
+        items = items[:limit]
 
     print(f"Loaded {len(items):,} items (skipped {skipped:,})")
     return items
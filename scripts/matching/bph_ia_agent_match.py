@@ -102,13 +102,17 @@ def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
+# Strips combining marks (Unicode category Mn) left by NFKD and folds ligatures
+_FOLD_TABLE = {cp: None for cp in range(0x10000) if unicodedata.category(chr(cp)) == 'Mn'}
+_FOLD_TABLE.update({ord('æ'): 'ae', ord('œ'): 'oe'})
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for comparison."""
     if not text:
         return ""
     text = text.lower()
-    text = unicodedata.normalize('NFKD', text)
-    text = text.replace('æ', 'ae').replace('œ', 'oe')
+    text = unicodedata.normalize('NFKD', text).translate(_FOLD_TABLE)
     text = re.sub(r'[^\w\s]', ' ', text)
     text = ' '.join(text.split())
     return text
@@ -46,6 +46,9 @@ FUZZY_THRESHOLD_LOW = 70     # Low confidence, needs LLM
 IA_SEARCH_URL = "https://archive.org/advancedsearch.php"
 IA_METADATA_URL = "https://archive.org/metadata"
 
+# Supabase writes
+SAVE_BATCH_SIZE = 500  # Matches per apply_ia_matches call
+
 
 @dataclass
 class BPHWork:
@@ -86,13 +89,17 @@ def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
+# Strips combining marks (Unicode category Mn) left by NFKD and folds ligatures
+_FOLD_TABLE = {cp: None for cp in range(0x10000) if unicodedata.category(chr(cp)) == 'Mn'}
+_FOLD_TABLE.update({ord('æ'): 'ae', ord('œ'): 'oe'})
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for comparison."""
     if not text:
         return ""
     text = text.lower()
-    text = unicodedata.normalize('NFKD', text)
-    text = text.replace('æ', 'ae').replace('œ', 'oe')
+    text = unicodedata.normalize('NFKD', text).translate(_FOLD_TABLE)
     text = re.sub(r'[^\w\s]', ' ', text)
     text = ' '.join(text.split())
     return text
@@ -629,14 +636,10 @@ def save_matches_to_supabase(results: List[MatchResult], min_confidence: str = '
 
     print(f"\nSaving {len(matches_to_save)} matches to Supabase...")
 
-    saved = 0
-    errors = 0
-
-    for result in matches_to_save:
-        if not result.ia_work:
-            continue
-
-        update_data = {
+    matched_at = datetime.now().isoformat()
+    rows = [
+        {
+            'id': result.bph_work.id,
             'ia_identifier': result.ia_work.identifier,
             'ia_url': f"https://archive.org/details/{result.ia_work.identifier}",
             'ia_match_confidence': result.confidence,
@@ -644,15 +647,33 @@ def save_matches_to_supabase(results: List[MatchResult], min_confidence: str = '
             'ia_title_similarity': result.title_similarity,
             'ia_author_match': result.author_match,
             'ia_year_match': result.year_match,
-            'ia_matched_at': datetime.now().isoformat()
+            'ia_matched_at': matched_at
         }
+        for result in matches_to_save
+        if result.ia_work
+    ]
 
+    saved = 0
+    errors = 0
+
+    for i in range(0, len(rows), SAVE_BATCH_SIZE):
+        batch = rows[i:i + SAVE_BATCH_SIZE]
         try:
-            client.table('bph_works').update(update_data).eq('id', result.bph_work.id).execute()
-            saved += 1
+            # One UPDATE ... FROM per batch (see apply_ia_matches in db/supabase_ia_match_schema.sql)
+            response = client.rpc('apply_ia_matches', {'matches': batch}).execute()
+            saved += response.data or 0
+            continue
         except Exception as e:
-            print(f"  Error saving {result.bph_work.id}: {e}")
-            errors += 1
+            print(f"  Batch update failed ({e}), falling back to per-row updates")
+
+        for row in batch:
+            update_data = {k: v for k, v in row.items() if k != 'id'}
+            try:
+                client.table('bph_works').update(update_data).eq('id', row['id']).execute()
+                saved += 1
+            except Exception as e:
+                print(f"  Error saving {row['id']}: {e}")
+                errors += 1
 
     print(f"  Saved: {saved}, Errors: {errors}")
     return saved, errors
@@ -60,6 +60,11 @@ def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
+# Strips combining marks (Unicode category Mn) left by NFKD and folds ligatures
+_FOLD_TABLE = {cp: None for cp in range(0x10000) if unicodedata.category(chr(cp)) == 'Mn'}
+_FOLD_TABLE.update({ord('æ'): 'ae', ord('œ'): 'oe'})
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for comparison."""
     if not text:
@@ -67,8 +72,7 @@ def normalize_text(text: str) -> str:
     # Lowercase
     text = text.lower()
     # Normalize unicode (æ -> ae, etc.)
-    text = unicodedata.normalize('NFKD', text)
-    text = text.replace('æ', 'ae').replace('œ', 'oe')
+    text = unicodedata.normalize('NFKD', text).translate(_FOLD_TABLE)
     # Remove punctuation except spaces
     text = re.sub(r'[^\w\s]', ' ', text)
     # Normalize whitespace
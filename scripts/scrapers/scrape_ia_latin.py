@@ -7,12 +7,18 @@ Stores results in Supabase for cross-referencing with ISTC/USTC/BPH.
 """
 
 import os
+import re
 import json
 import time
 import requests
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from supabase import create_client, Client
 except ImportError:
@@ -31,6 +37,9 @@ SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXV
 # IA Scrape API
 SCRAPE_URL = "https://archive.org/services/search/v1/scrape"
 
+# 4-digit year (1400-2099) in IA date strings
+_YEAR_RE = re.compile(r'\b(1[4-9]\d{2}|20\d{2})\b')
+
 def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
@@ -62,7 +71,7 @@ def scrape_ia_latin(query: str, fields: list[str], max_items: int = None):
         try:
             response = requests.get(SCRAPE_URL, params=params, timeout=60)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
         except requests.exceptions.RequestException as e:
             print(f"Request error: {e}")
             print("Waiting 30 seconds before retry...")
@@ -94,41 +103,47 @@ def scrape_ia_latin(query: str, fields: list[str], max_items: int = None):
         if total_retrieved % 1000 == 0:
             print(f"  Retrieved {total_retrieved:,} items...")
 
-def transform_ia_item(item: dict) -> dict:
-    """Transform IA item to our schema."""
-    # Handle fields that might be lists
-    def get_first(val):
-        if isinstance(val, list):
-            return val[0] if val else None
-        return val
-
-    def get_year(date_val):
-        """Extract year from various date formats."""
-        if not date_val:
-            return None
-        date_str = str(get_first(date_val))
-        # Try to extract 4-digit year
-        import re
-        match = re.search(r'\b(1[4-9]\d{2}|20\d{2})\b', date_str)
-        if match:
-            return int(match.group(1))
+def _get_first(val):
+    """Return the first element of a list-valued IA field."""
+    if isinstance(val, list):
+        return val[0] if val else None
+    return val
+
+def _get_year(date_val):
+    """Extract year from various date formats."""
+    if not date_val:
         return None
+    # Try to extract 4-digit year
+    match = _YEAR_RE.search(str(_get_first(date_val)))
+    if match:
+        return int(match.group(1))
+    return None
 
+def transform_ia_item(item: dict) -> dict:
+    """Transform IA item to our schema."""
     return {
         'identifier': item.get('identifier'),
-        'title': get_first(item.get('title')),
-        'creator': get_first(item.get('creator')),
-        'date_raw': get_first(item.get('date')),
-        'year': get_year(item.get('date')),
+        'title': _get_first(item.get('title')),
+        'creator': _get_first(item.get('creator')),
+        'date_raw': _get_first(item.get('date')),
+        'year': _get_year(item.get('date')),
         'subject': item.get('subject') if isinstance(item.get('subject'), list) else [item.get('subject')] if item.get('subject') else [],
-        'language': get_first(item.get('language')),
-        'mediatype': get_first(item.get('mediatype')),
+        'language': _get_first(item.get('language')),
+        'mediatype': _get_first(item.get('mediatype')),
         'collection': item.get('collection') if isinstance(item.get('collection'), list) else [item.get('collection')] if item.get('collection') else [],
-        'description': get_first(item.get('description'))[:2000] if item.get('description') else None,
+        'description': _get_first(item.get('description'))[:2000] if item.get('description') else None,
         'downloads': item.get('downloads'),
         'item_size': item.get('item_size'),
     }
 
+def write_json(path: Path, data: dict):
+    """Write data as indented JSON, using orjson when available."""
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 def upload_to_supabase(items: list, table: str = 'ia_latin_texts'):
     """Upload items to Supabase in batches."""
     client = get_supabase_client()
@@ -209,16 +224,15 @@ def main():
 
     # Save to JSON
     json_path = OUTPUT_DIR / f"ia_latin_{timestamp}.json"
-    with open(json_path, 'w') as f:
-        json.dump({
-            'metadata': {
-                'timestamp': timestamp,
-                'total_items': len(all_items),
-                'early_modern_items': len(early_modern),
-                'queries': [q[0] for q in queries],
-            },
-            'items': list(all_items.values())
-        }, f, indent=2)
+    write_json(json_path, {
+        'metadata': {
+            'timestamp': timestamp,
+            'total_items': len(all_items),
+            'early_modern_items': len(early_modern),
+            'queries': [q[0] for q in queries],
+        },
+        'items': list(all_items.values())
+    })
     print(f"\nSaved to: {json_path}")
 
     # Upload to Supabase
@@ -10,13 +10,193 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Set
 from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Hamming
 from unidecode import unidecode
 import logging
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the grouping kernel runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# MinHash LSH blocking of titles: 32 bands of 4 rows puts pairs whose title
+# shingle sets have Jaccard similarity around 0.4 or more in a shared bucket
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 32
+SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_text(text: str) -> str:
+    """Cached body of RecordDeduplicator.normalize_text for non-null strings."""
+    # Convert to lowercase and remove accents
+    text = text.lower()
+    text = unidecode(text)
+
+    # Remove punctuation and extra whitespace
+    text = _PUNCT_RE.sub(' ', text)
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+
+    return text
+
+
+@njit(cache=True)
+def _absorb_duplicates(left: np.ndarray, right: np.ndarray, seed_of: np.ndarray) -> None:
+    """Seed-assignment loop of assign_seed_groups over pairs sorted by (left, right)."""
+    for k in range(left.shape[0]):
+        i = left[k]
+        j = right[k]
+        if seed_of[i] == -1:
+            seed_of[i] = i
+        if seed_of[i] == i and seed_of[j] == -1:
+            seed_of[j] = i
+
+
+def assign_seed_groups(left: np.ndarray, right: np.ndarray, n: int) -> np.ndarray:
+    """
+    Assign records to duplicate groups from a list of duplicate pairs.
+
+    Pairs are visited in (left, right) order. A record that has not been
+    absorbed when it is first visited becomes a seed and absorbs every later
+    record it duplicates that is still unassigned.
+
+    Args:
+        left: Row positions of the first record of each duplicate pair
+        right: Row positions of the second record (left < right)
+        n: Total number of records
+
+    Returns:
+        int32 array with the seed position of each record's group, or -1
+        for records without duplicates
+    """
+    seed_of = np.full(n, -1, dtype=np.int32)
+    order = np.lexsort((right, left))
+    _absorb_duplicates(left[order].astype(np.int32), right[order].astype(np.int32), seed_of)
+
+    # Seeds whose duplicates were all absorbed elsewhere stay single records
+    assigned = seed_of >= 0
+    sizes = np.bincount(seed_of[assigned], minlength=n)
+    seed_of[assigned & (sizes[np.maximum(seed_of, 0)] < 2)] = -1
+
+    return seed_of
+
+
+def title_shingles(title: str, k: int = SHINGLE_SIZE) -> Set[str]:
+    """Character k-grams of a normalized title (the title itself if shorter)."""
+    if len(title) <= k:
+        return {title} if title else set()
+    return {title[i:i + k] for i in range(len(title) - k + 1)}
+
+
+def minhash_signatures(shingle_sets: List[Set[str]], num_perm: int = MINHASH_PERMUTATIONS,
+                       seed: int = 1) -> np.ndarray:
+    """
+    Compute MinHash signatures for a list of shingle sets.
+
+    Each permutation is a universal hash (a * x + b) mod p over integer
+    shingle ids, and the signature holds the minimum hash per permutation.
+
+    Args:
+        shingle_sets: One set of shingles per record
+        num_perm: Number of hash permutations
+        seed: Seed for the permutation coefficients
+
+    Returns:
+        int64 array of shape (len(shingle_sets), num_perm); rows of empty
+        sets are filled with the prime p
+    """
+    vocabulary = {}
+    shingle_ids = [[vocabulary.setdefault(shingle, len(vocabulary)) for shingle in shingles]
+                   for shingles in shingle_sets]
+    sizes = np.array([len(ids) for ids in shingle_ids], dtype=np.int64)
+    flat_ids = np.fromiter((i for ids in shingle_ids for i in ids),
+                           dtype=np.int64, count=int(sizes.sum()))
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MERSENNE_PRIME, num_perm)
+    b = rng.integers(0, _MERSENNE_PRIME, num_perm)
+
+    signatures = np.full((len(shingle_sets), num_perm), _MERSENNE_PRIME, dtype=np.int64)
+    nonempty = sizes > 0
+    starts = (np.cumsum(sizes) - sizes)[nonempty]
+    if len(starts):
+        for p in range(num_perm):
+            hashed = (a[p] * flat_ids + b[p]) % _MERSENNE_PRIME
+            signatures[nonempty, p] = np.minimum.reduceat(hashed, starts)
+
+    return signatures
+
+
+def window_pairs(codes: np.ndarray, years: np.ndarray,
+                 tolerance: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All pairs of rows sharing a block code with years at most tolerance apart.
+
+    Args:
+        codes: Non-negative block code per row, or -1 to leave the row out
+        years: Integer year per row
+        tolerance: Maximum year difference within a pair
+
+    Returns:
+        Tuple of (left, right) row position arrays with left < right
+    """
+    years = years - years.min(initial=0)
+
+    # Sort by (code, year) and encode both in one key so that a single
+    # searchsorted finds where each row's window ends
+    order = np.lexsort((years, codes))
+    order = order[codes[order] >= 0]
+    span = years.max(initial=0) + tolerance + 1
+    key = codes[order] * span + years[order]
+    window_end = np.searchsorted(key, key + tolerance, side='right')
+
+    counts = window_end - np.arange(len(key)) - 1
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    first = np.repeat(np.arange(len(key)), counts)
+    offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[first + 1 + offset]
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def encode_token_sets(token_sets: List[Set[str]]) -> Dict[str, np.ndarray]:
+    """
+    Encode token sets as integer ids once so pair intersections become array lookups.
+
+    Args:
+        token_sets: One set of tokens per record
+
+    Returns:
+        Dictionary with per-record 'sizes' and 'offsets' into the flat 'ids'
+        array, plus 'membership': sorted record * vocab_size + token_id keys
+    """
+    vocabulary = {}
+    token_ids = [[vocabulary.setdefault(token, len(vocabulary)) for token in tokens]
+                 for tokens in token_sets]
+    sizes = np.array([len(ids) for ids in token_ids], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    ids = np.fromiter((t for record_ids in token_ids for t in record_ids),
+                      dtype=np.int64, count=int(offsets[-1]))
+    vocab_size = max(len(vocabulary), 1)
+    membership = np.sort(np.repeat(np.arange(len(token_sets), dtype=np.int64), sizes)
+                         * vocab_size + ids)
+
+    return {'sizes': sizes, 'offsets': offsets, 'ids': ids,
+            'membership': membership, 'vocab_size': vocab_size}
+
 
 class RecordDeduplicator:
     """
@@ -54,6 +234,10 @@ class RecordDeduplicator:
             'processing_time': None
         }
 
+        # Overall scores of pairs within each duplicate group, keyed by
+        # (index_a, index_b), filled by find_duplicate_groups
+        self._pair_scores = {}
+
     def normalize_text(self, text: str) -> str:
         """
         Normalize text for comparison.
@@ -67,15 +251,7 @@ class RecordDeduplicator:
         if pd.isna(text) or text is None:
             return ""
 
-        # Convert to lowercase and remove accents
-        text = str(text).lower()
-        text = unidecode(text)
-
-        # Remove punctuation and extra whitespace
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text
+        return _normalize_text(str(text))
 
     def extract_keywords(self, title: str) -> Set[str]:
         """
@@ -297,15 +473,326 @@ class RecordDeduplicator:
         """
         scores = self.calculate_overall_similarity(record1, record2)
 
-        # Apply threshold logic
+        return self._passes_thresholds(scores), scores
+
+    def _passes_thresholds(self, scores: Dict) -> bool:
+        """Apply the title, author and overall thresholds to a score dict."""
         title_pass = scores['title'] >= self.title_similarity_threshold
         author_pass = scores['author'] >= self.author_similarity_threshold
 
         # Overall score must meet threshold
-        is_duplicate = (scores['overall'] >= self.overall_score_threshold and
-                       title_pass and author_pass)
+        return (scores['overall'] >= self.overall_score_threshold and
+                title_pass and author_pass)
+
+    def _record_features(self, df: pd.DataFrame) -> Dict:
+        """
+        Precompute the per-record inputs used by pair scoring.
+
+        Args:
+            df: DataFrame with title_normalized/author_normalized columns
+
+        Returns:
+            Dictionary of per-record lists and arrays aligned with df rows
+        """
+        n = len(df)
+        features = {}
+
+        features['titles'] = df['title_normalized'].tolist()
+        features['has_title'] = df['title'].notna().to_numpy()
+        features['title_words'] = encode_token_sets(
+            [set(title.split()) for title in features['titles']])
+        features['keywords'] = encode_token_sets(
+            [self.extract_keywords(title) if present else set()
+             for title, present in zip(df['title'], features['has_title'])])
+
+        features['authors'] = df['author_normalized'].tolist()
+        features['has_author'] = df['author'].notna().to_numpy()
+        author_words = [author.split() for author in features['authors']]
+        features['surnames'] = np.array([words[-1] if words else '' for words in author_words],
+                                        dtype=object)
+        features['word_counts'] = np.array([len(words) for words in author_words])
+        features['initials'] = [''.join(word[0] for word in words) for words in author_words]
+
+        if 'publication_year' in df:
+            features['years'] = pd.to_numeric(df['publication_year'],
+                                              errors='coerce').to_numpy(dtype=float)
+        else:
+            features['years'] = np.full(n, np.nan)
+
+        if 'publication_place' in df:
+            features['has_place'] = df['publication_place'].notna().to_numpy()
+            features['places'] = [self.normalize_text(place) for place in df['publication_place']]
+        else:
+            features['has_place'] = np.zeros(n, dtype=bool)
+            features['places'] = [''] * n
+        features['place_words'] = encode_token_sets(
+            [set(place.split()) for place in features['places']])
+
+        return features
+
+    def _pair_similarity(self, features: Dict, left: np.ndarray, right: np.ndarray,
+                         early_exit: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Score many candidate pairs at once with vectorized operations.
+
+        process.cpdist runs the fuzzy comparisons for every pair in one C++ call
+        across all cores, and the field rules and weights of
+        calculate_overall_similarity are then applied with NumPy.
 
-        return is_duplicate, scores
+        Args:
+            features: Output of _record_features
+            left: Row positions of the first record of each pair
+            right: Row positions of the second record of each pair
+            early_exit: Pass score_cutoff to RapidFuzz so fuzzy scores too low
+                for the title/author thresholds come back as 0. 'duplicate' is
+                unaffected, and scores stay exact for duplicate pairs only.
+
+        Returns:
+            Dictionary of per-pair arrays: per-field and overall scores (0-1)
+            plus a boolean 'duplicate' array
+        """
+        def cpdist(key, scorer, cutoff=None, pairs=slice(None)):
+            choices = features[key]
+            return process.cpdist([choices[i] for i in left[pairs]],
+                                  [choices[j] for j in right[pairs]],
+                                  scorer=scorer, dtype=np.float32, workers=-1,
+                                  score_cutoff=cutoff if early_exit else None
+                                  ).astype(np.float64)
+
+        def cutoff(threshold, others, weight):
+            # Lowest 0-100 score that still lets the field reach its threshold
+            # when every other component is at its maximum
+            return max(0.0, (threshold - others) / weight * 100.0 - 1e-6)
+
+        def both(key):
+            return features[key][left] & features[key][right]
+
+        scores = {}
+
+        # Title similarity
+        keywords = features['keywords']
+        has_keywords = keywords['sizes'] > 0
+        keyword_similarity = np.where(
+            has_keywords[left] & has_keywords[right],
+            self._pair_jaccard(keywords, left, right),
+            np.where(~has_keywords[left] & ~has_keywords[right], 1.0, 0.0)
+        )
+        # token_set_ratio is 100 whenever one title's word set contains the
+        # other's, which the token ids answer without RapidFuzz retokenizing
+        title_words = features['title_words']
+        shared_words = self._pair_intersection(title_words, left, right)
+        contained = (shared_words > 0) & (shared_words == np.minimum(
+            title_words['sizes'][left], title_words['sizes'][right]))
+        title_threshold = self.title_similarity_threshold
+        token_set_similarity = np.full(len(left), 100.0)
+        token_set_similarity[~contained] = cpdist('titles', fuzz.token_set_ratio,
+                                                  cutoff(title_threshold, 0.6, 0.4), ~contained)
+        title_similarity = (
+            cpdist('titles', fuzz.ratio, cutoff(title_threshold, 0.7, 0.3)) / 100.0 * 0.3 +
+            token_set_similarity / 100.0 * 0.4 +
+            keyword_similarity * 0.3
+        )
+        scores['title'] = np.where(both('has_title'), title_similarity, 0.0)
+
+        # Author similarity: exact surname match, else fuzzy ratio plus initials bonus
+        surnames = features['surnames']
+        word_counts = features['word_counts']
+        surname_match = (surnames[left] == surnames[right]) & (surnames[left] != '')
+        same_length = (word_counts[left] == word_counts[right]) & (word_counts[left] > 0)
+        bonus = np.where(same_length,
+                         cpdist('initials', Hamming.similarity)
+                         / np.maximum(word_counts[left], 1) * 0.2, 0.0)
+        author_similarity = np.where(
+            surname_match, 1.0,
+            np.minimum(1.0, cpdist('authors', fuzz.ratio,
+                                   cutoff(self.author_similarity_threshold, 0.2, 1.0)) / 100.0 + bonus)
+        )
+        scores['author'] = np.where(both('has_author'), author_similarity, 0.0)
+
+        # Date similarity
+        diff = np.abs(features['years'][left] - features['years'][right])
+        date_similarity = np.select(
+            [diff == 0, diff <= 1, diff <= 2,
+             diff <= self.date_tolerance_years, diff <= self.date_tolerance_years * 2],
+            [1.0, 0.9, 0.7, 0.5, 0.3],
+            default=0.1
+        )
+        scores['date'] = np.where(np.isnan(diff), 0.0, date_similarity)
+
+        # Place similarity: fuzzy ratio, raised to word overlap when both have words
+        place_words = features['place_words']
+        has_place_words = place_words['sizes'] > 0
+        place_similarity = cpdist('places', fuzz.ratio) / 100.0
+        place_similarity = np.where(
+            has_place_words[left] & has_place_words[right],
+            np.maximum(place_similarity, self._pair_jaccard(place_words, left, right)),
+            place_similarity
+        )
+        scores['place'] = np.where(both('has_place'), place_similarity, 0.0)
+
+        # Calculate weighted overall score
+        scores['overall'] = sum(scores[field] * weight
+                                for field, weight in self.weights.items())
+
+        scores['duplicate'] = ((scores['overall'] >= self.overall_score_threshold) &
+                               (scores['title'] >= self.title_similarity_threshold) &
+                               (scores['author'] >= self.author_similarity_threshold))
+
+        return scores
+
+    def _viable_pairs(self, features: Dict, left: np.ndarray,
+                      right: np.ndarray) -> np.ndarray:
+        """
+        Cheaply rule out pairs that cannot pass the duplicate thresholds.
+
+        fuzz.ratio is bounded by the length ratio, 2 * min(|a|, |b|) / (|a| + |b|),
+        and Jaccard similarity by min(|A|, |B|) / max(|A|, |B|), so upper bounds
+        on the title, author and overall scores follow from lengths alone.
+
+        Args:
+            features: Output of _record_features
+            left: Row positions of the first record of each pair
+            right: Row positions of the second record of each pair
+
+        Returns:
+            Boolean array, False where the pair can never be a duplicate
+        """
+        def lengths(key):
+            return np.fromiter((len(value) for value in features[key]),
+                               dtype=np.int64, count=len(features[key]))
+
+        def ratio_bound(key):
+            sizes = lengths(key)
+            a, b = sizes[left], sizes[right]
+            return np.divide(2 * np.minimum(a, b), a + b, out=np.ones(len(left)),
+                             where=(a + b) > 0)
+
+        def jaccard_bound(key):
+            sizes = features[key]['sizes']
+            a, b = sizes[left], sizes[right]
+            return np.divide(np.minimum(a, b), np.maximum(a, b), out=np.ones(len(left)),
+                             where=np.maximum(a, b) > 0)
+
+        def both(key):
+            return features[key][left] & features[key][right]
+
+        # Slack for float32 rounding of the RapidFuzz scores
+        slack = 1e-6
+
+        # Title: token_set_ratio has no length bound, so it counts as 1
+        title_bound = ratio_bound('titles') * 0.3 + 0.4 + jaccard_bound('keywords') * 0.3
+        title_bound = np.where(both('has_title'), title_bound + slack, 0.0)
+
+        # Author: an exact surname match scores 1, otherwise ratio plus initials bonus
+        surnames = features['surnames']
+        word_counts = features['word_counts']
+        surname_match = (surnames[left] == surnames[right]) & (surnames[left] != '')
+        same_length = (word_counts[left] == word_counts[right]) & (word_counts[left] > 0)
+        author_bound = np.where(surname_match, 1.0,
+                                np.minimum(1.0, ratio_bound('authors') + same_length * 0.2))
+        author_bound = np.where(both('has_author'), author_bound + slack, 0.0)
+
+        # Date is exact and cheap
+        diff = np.abs(features['years'][left] - features['years'][right])
+        date_similarity = np.select(
+            [diff == 0, diff <= 1, diff <= 2,
+             diff <= self.date_tolerance_years, diff <= self.date_tolerance_years * 2],
+            [1.0, 0.9, 0.7, 0.5, 0.3],
+            default=0.1
+        )
+        date_similarity = np.where(np.isnan(diff), 0.0, date_similarity)
+
+        place_bound = np.maximum(ratio_bound('places'), jaccard_bound('place_words'))
+        place_bound = np.where(both('has_place'), place_bound + slack, 0.0)
+
+        bounds = {'title': title_bound, 'author': author_bound,
+                  'date': date_similarity, 'place': place_bound}
+        overall_bound = sum(bounds[field] * weight for field, weight in self.weights.items())
+
+        return ((overall_bound >= self.overall_score_threshold) &
+                (title_bound >= self.title_similarity_threshold) &
+                (author_bound >= self.author_similarity_threshold))
+
+    def _pair_intersection(self, tokens: Dict[str, np.ndarray], left: np.ndarray,
+                           right: np.ndarray) -> np.ndarray:
+        """
+        Number of shared tokens for each candidate pair.
+
+        Args:
+            tokens: Output of encode_token_sets
+            left: Row positions of the first record of each pair
+            right: Row positions of the second record of each pair
+
+        Returns:
+            Array of intersection sizes
+        """
+        sizes, offsets = tokens['sizes'], tokens['offsets']
+        vocab_size = tokens['vocab_size']
+
+        # For every token of the left record, check whether the right record has it
+        left_sizes = sizes[left]
+        pair_of_token = np.repeat(np.arange(len(left)), left_sizes)
+        token_position = (np.arange(int(left_sizes.sum()))
+                          - np.repeat(np.cumsum(left_sizes) - left_sizes, left_sizes)
+                          + np.repeat(offsets[left], left_sizes))
+        keys = np.repeat(np.asarray(right, dtype=np.int64), left_sizes) * vocab_size \
+            + tokens['ids'][token_position]
+        shared = np.isin(keys, tokens['membership'])
+        return np.bincount(pair_of_token[shared], minlength=len(left))
+
+    def _pair_jaccard(self, tokens: Dict[str, np.ndarray], left: np.ndarray,
+                      right: np.ndarray) -> np.ndarray:
+        """
+        Jaccard similarity of token sets for each candidate pair.
+
+        Args:
+            tokens: Output of encode_token_sets
+            left: Row positions of the first record of each pair
+            right: Row positions of the second record of each pair
+
+        Returns:
+            Array of Jaccard similarities (0 where both sets are empty)
+        """
+        sizes = tokens['sizes']
+        intersection = self._pair_intersection(tokens, left, right)
+        union = sizes[left] + sizes[right] - intersection
+        return np.divide(intersection, union, out=np.zeros(len(left)), where=union > 0)
+
+    def _candidate_pairs(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate each candidate pair of rows exactly once.
+
+        Titles are blocked with MinHash LSH over character shingles, so
+        records land in a shared bucket when their titles are similar
+        anywhere, not just in the first few characters. Within a bucket
+        only records at most date_tolerance_years apart are paired.
+
+        Args:
+            df: DataFrame with title_normalized and publication_year columns
+
+        Returns:
+            Tuple of (left, right) row position arrays with left < right
+        """
+        n = len(df)
+        years = df['publication_year'].fillna(0).to_numpy(dtype=np.int64)
+        tolerance = int(self.date_tolerance_years)
+
+        # Records without a title can never pass the title threshold
+        shingles = [title_shingles(title) for title in df['title_normalized']]
+        has_shingles = np.array([bool(s) for s in shingles])
+        signatures = minhash_signatures(shingles)
+
+        keys = []
+        rows = MINHASH_PERMUTATIONS // LSH_BANDS
+        for band in range(LSH_BANDS):
+            _, bucket = np.unique(signatures[:, band * rows:(band + 1) * rows],
+                                  axis=0, return_inverse=True)
+            bucket = np.where(has_shingles, bucket.reshape(-1), -1)
+            left, right = window_pairs(bucket, years, tolerance)
+            keys.append(left.astype(np.int64) * n + right)
+
+        keys = np.unique(np.concatenate(keys)) if keys else np.empty(0, dtype=np.int64)
+        return (keys // n).astype(np.intp), (keys % n).astype(np.intp)
 
     def find_duplicate_groups(self, df: pd.DataFrame) -> List[List[int]]:
         """
@@ -324,48 +811,45 @@ class RecordDeduplicator:
         df['title_normalized'] = df['title'].apply(self.normalize_text)
         df['author_normalized'] = df['author'].apply(self.normalize_text)
 
-        # Group by basic criteria first (year, first letter of title/author)
-        df['title_first'] = df['title_normalized'].str[:3]
         df['author_first'] = df['author_normalized'].str[:3]
-        df['year_bucket'] = df['publication_year'].fillna(0).astype(int) // 5
-
-        # Find potential matches within groups
-        groups = []
-        processed = set()
-
-        for idx, record in df.iterrows():
-            if idx in processed:
-                continue
-
-            # Find potential matches
-            matches = [idx]
-            processed.add(idx)
-
-            # Filter potential matches by basic criteria
-            potential_matches = df[
-                (df.index != idx) &
-                (~df.index.isin(processed)) &
-                (df['year_bucket'] == record['year_bucket']) &
-                (df['title_first'] == record['title_first'])
-            ]
-
-            # Check each potential match
-            for match_idx, match_record in potential_matches.iterrows():
-                is_duplicate, scores = self.is_duplicate_pair(
-                    record.to_dict(), match_record.to_dict()
-                )
-
-                if is_duplicate:
-                    matches.append(match_idx)
-                    processed.add(match_idx)
 
-            if len(matches) > 1:
-                groups.append(matches)
+        # Collect every LSH candidate pair once, drop those whose length-based
+        # upper bounds already fall short, then score the rest in bulk
+        left, right = self._candidate_pairs(df)
+        features = self._record_features(df)
+        viable = self._viable_pairs(features, left, right)
+        scores = self._pair_similarity(features, left[viable], right[viable], early_exit=True)
+        duplicate = np.zeros(len(left), dtype=bool)
+        duplicate[viable] = scores['duplicate']
+
+        # Greedy grouping: each record not yet absorbed by an earlier record
+        # becomes a seed and absorbs its later, still unassigned duplicates
+        seed_of = assign_seed_groups(left[duplicate], right[duplicate], len(df))
+
+        # Remember within-group scores for the group confidence calculation;
+        # only duplicate pairs were scored exactly above, so other pairs that
+        # ended up in one group are rescored in full
+        same_group = (seed_of[left] >= 0) & (seed_of[left] == seed_of[right])
+        overall = np.full(len(left), np.nan)
+        overall[viable] = scores['overall']
+        unscored = same_group & ~duplicate
+        if unscored.any():
+            overall[unscored] = self._pair_similarity(
+                features, left[unscored], right[unscored])['overall']
+        self._pair_scores = dict(zip(
+            zip(df.index[left[same_group]], df.index[right[same_group]]),
+            overall[same_group].tolist()
+        ))
+
+        # Keep groups in the order their seed record appears in the input
+        grouped = np.flatnonzero(seed_of >= 0)
+        order = grouped[np.argsort(seed_of[grouped], kind='stable')]
+        _, starts = np.unique(seed_of[order], return_index=True)
+        groups = [df.index[part].tolist() for part in np.split(order, starts[1:])] \
+            if len(order) else []
 
         # Add single records (non-duplicates)
-        all_indices = set(df.index)
-        duplicate_indices = set(idx for group in groups for idx in group)
-        single_indices = list(all_indices - duplicate_indices)
+        single_indices = df.index[seed_of < 0].tolist()
 
         for idx in single_indices:
             groups.append([idx])
@@ -552,16 +1036,18 @@ class RecordDeduplicator:
         if len(group) == 1:
             return 1.0
 
-        # Calculate pairwise similarities within the group
+        # Calculate pairwise similarities within the group, reusing the
+        # scores already computed by find_duplicate_groups
         similarities = []
-        group_records = df.loc[group]
 
         for i in range(len(group)):
             for j in range(i + 1, len(group)):
-                record1 = group_records.iloc[group[i]].to_dict()
-                record2 = group_records.iloc[group[j]].to_dict()
-                scores = self.calculate_overall_similarity(record1, record2)
-                similarities.append(scores['overall'])
+                overall = self._pair_scores.get((group[i], group[j]))
+                if overall is None:
+                    overall = self.calculate_overall_similarity(
+                        df.loc[group[i]].to_dict(), df.loc[group[j]].to_dict()
+                    )['overall']
+                similarities.append(overall)
 
         # Return average similarity as confidence
         return np.mean(similarities) if similarities else 0.0